@@ -39,6 +39,16 @@ target_metadata = TargetBase.metadata
 # or provide the value for %(DB_URL)s if you used that.
 # Ensure DATABASE_URL in your .env or environment is correctly set.
 config.set_main_option('sqlalchemy.url', app_settings.DATABASE_URL)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    # Full-text search objects are managed by hand-written migrations
+    # (FTS5 shadow tables on SQLite, the generated search_vector column on PostgreSQL).
+    if type_ == "table" and name.startswith("properties_fts"):
+        return False
+    if type_ == "column" and name == "search_vector":
+        return False
+    return True
 # --- End of Habitat App specific configuration ---
 
 # other values from the config, defined by the needs of env.py,
@@ -65,6 +75,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -86,7 +97,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,48 @@
+"""add property sort indexes
+
+Revision ID: a4d8e2f7c913
+Revises: f3c6a9d2e815
+Create Date: 2026-10-18 13:17:52.419063
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e2f7c913'
+down_revision: Union[str, None] = 'f3c6a9d2e815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (sort column, id) indexes for the listing sorts; they also serve the
+# price and area range filters, so they replace the single-column ones.
+INDEXES = [
+    ('ix_properties_price_id', 'properties', ['price', 'id']),
+    ('ix_properties_square_feet_id', 'properties', ['square_feet', 'id']),
+    ('ix_properties_created_at_id', 'properties', ['created_at', 'id']),
+    ('ix_properties_is_featured_id', 'properties', ['is_featured', 'id']),
+]
+REPLACED_INDEXES = [
+    ('ix_properties_price', 'properties', ['price']),
+    ('ix_properties_square_feet', 'properties', ['square_feet']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table, _columns in REPLACED_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, columns in REPLACED_INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
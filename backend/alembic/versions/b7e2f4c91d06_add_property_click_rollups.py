@@ -0,0 +1,58 @@
+"""add property click rollups
+
+Revision ID: b7e2f4c91d06
+Revises: a4d8e2f7c913
+Create Date: 2026-10-18 16:42:08.173526
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f4c91d06'
+down_revision: Union[str, None] = 'a4d8e2f7c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'property_click_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('property_id', sa.Integer(), nullable=False),
+        sa.Column('granularity', sa.String(length=8), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('unique_ips', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('property_id', 'granularity', 'bucket_start', name='uq_property_click_rollups_bucket'),
+    )
+    op.create_index(
+        'ix_property_click_rollups_granularity_bucket_start', 'property_click_rollups',
+        ['granularity', 'bucket_start'], unique=False
+    )
+    op.create_table(
+        'job_checkpoints',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.create_index(
+        'ix_property_clicks_property_id_clicked_at', 'property_clicks',
+        ['property_id', 'clicked_at'], unique=False, if_not_exists=True
+    )
+    # The rollup job starts from checkpoint 0, so existing clicks are rolled up on its first runs.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_property_clicks_property_id_clicked_at', table_name='property_clicks', if_exists=True)
+    op.drop_table('job_checkpoints')
+    op.drop_index('ix_property_click_rollups_granularity_bucket_start', table_name='property_click_rollups')
+    op.drop_table('property_click_rollups')
@@ -0,0 +1,42 @@
+"""add property visitor sketches
+
+Revision ID: c2d9a6e3f158
+Revises: b7e2f4c91d06
+Create Date: 2026-10-18 17:48:31.604217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d9a6e3f158'
+down_revision: Union[str, None] = 'b7e2f4c91d06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'property_visitor_sketches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('property_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('sketch', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('property_id', 'day', name='uq_property_visitor_sketches_day'),
+    )
+    # Sketches are built by the click rollup job; reset its checkpoint so the
+    # existing click log is folded into them (the rollups are recomputed idempotently).
+    # Each batch only re-reads the rollup buckets and sketch days it touches, so
+    # the replay is one linear pass over the log.
+    op.execute(sa.text("DELETE FROM job_checkpoints WHERE name = 'property_click_rollups'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('property_visitor_sketches')
@@ -0,0 +1,81 @@
+"""add property full text search
+
+Revision ID: c4e8f1a2b3d5
+Revises: 76bac7b851b5
+Create Date: 2026-10-18 09:12:40.218311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8f1a2b3d5'
+down_revision: Union[str, None] = '76bac7b851b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Kept in sync with PROPERTY_FTS_SQLITE_DDL / PROPERTY_FTS_POSTGRES_DDL in models.py,
+# which create the same objects on databases built with metadata.create_all().
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5("
+    "title, location, description, content='properties', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_ai AFTER INSERT ON properties BEGIN "
+    "INSERT INTO properties_fts(rowid, title, location, description) "
+    "VALUES (new.id, new.title, new.location, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_ad AFTER DELETE ON properties BEGIN "
+    "INSERT INTO properties_fts(properties_fts, rowid, title, location, description) "
+    "VALUES ('delete', old.id, old.title, old.location, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_au AFTER UPDATE OF title, location, description ON properties BEGIN "
+    "INSERT INTO properties_fts(properties_fts, rowid, title, location, description) "
+    "VALUES ('delete', old.id, old.title, old.location, old.description); "
+    "INSERT INTO properties_fts(rowid, title, location, description) "
+    "VALUES (new.id, new.title, new.location, new.description); END",
+    # Index the rows that already exist
+    "INSERT INTO properties_fts(properties_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS properties_fts_au",
+    "DROP TRIGGER IF EXISTS properties_fts_ad",
+    "DROP TRIGGER IF EXISTS properties_fts_ai",
+    "DROP TABLE IF EXISTS properties_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "ALTER TABLE properties ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_properties_search_vector ON properties USING GIN (search_vector)",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_properties_search_vector",
+    "ALTER TABLE properties DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements) -> None:
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_UPGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_UPGRADE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_DOWNGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_DOWNGRADE)
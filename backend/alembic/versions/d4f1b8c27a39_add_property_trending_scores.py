@@ -0,0 +1,35 @@
+"""add property trending scores
+
+Revision ID: d4f1b8c27a39
+Revises: c2d9a6e3f158
+Create Date: 2026-10-18 18:36:12.950471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1b8c27a39'
+down_revision: Union[str, None] = 'c2d9a6e3f158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'property_trending_scores',
+        sa.Column('property_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('scored_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('property_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('property_trending_scores')
+    op.execute(sa.text("DELETE FROM job_checkpoints WHERE name = 'property_trending'"))
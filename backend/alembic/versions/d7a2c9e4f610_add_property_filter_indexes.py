@@ -0,0 +1,45 @@
+"""add property filter indexes
+
+Revision ID: d7a2c9e4f610
+Revises: c4e8f1a2b3d5
+Create Date: 2026-10-18 10:03:15.774902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c9e4f610'
+down_revision: Union[str, None] = 'c4e8f1a2b3d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # Composite indexes for the get_properties filter matrix
+    ('ix_properties_listing_type_property_type_price', 'properties', ['listing_type', 'property_type', 'price']),
+    ('ix_properties_property_type_price', 'properties', ['property_type', 'price']),
+    ('ix_properties_price', 'properties', ['price']),
+    ('ix_properties_bedrooms_bathrooms', 'properties', ['bedrooms', 'bathrooms']),
+    ('ix_properties_square_feet', 'properties', ['square_feet']),
+    ('ix_properties_assigned_to_id_id', 'properties', ['assigned_to_id', 'id']),
+    # Previously unindexed foreign keys
+    ('ix_property_images_property_id', 'property_images', ['property_id']),
+    ('ix_property_clicks_property_id', 'property_clicks', ['property_id']),
+    ('ix_contacts_assigned_to_id', 'contacts', ['assigned_to_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,35 @@
+"""add property click_count
+
+Revision ID: e1b5d3a8c742
+Revises: d7a2c9e4f610
+Create Date: 2026-10-18 11:20:04.561377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b5d3a8c742'
+down_revision: Union[str, None] = 'd7a2c9e4f610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain ADD COLUMN (no batch mode) so SQLite keeps the FTS triggers on properties
+    op.add_column('properties', sa.Column('click_count', sa.Integer(), nullable=False, server_default='0'))
+    # Backfill from the raw click log
+    op.execute(sa.text(
+        "UPDATE properties SET click_count = "
+        "(SELECT COUNT(*) FROM property_clicks WHERE property_clicks.property_id = properties.id)"
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Native DROP COLUMN (SQLite >= 3.35) rather than a batch table rebuild, which would drop the FTS triggers
+    op.execute(sa.text("ALTER TABLE properties DROP COLUMN click_count"))
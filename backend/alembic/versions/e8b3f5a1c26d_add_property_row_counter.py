@@ -0,0 +1,78 @@
+"""add property row counter
+
+Revision ID: e8b3f5a1c26d
+Revises: d4f1b8c27a39
+Create Date: 2026-10-18 21:04:37.518290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3f5a1c26d'
+down_revision: Union[str, None] = 'd4f1b8c27a39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Kept in sync with PROPERTY_ROW_COUNT_SQLITE_DDL / PROPERTY_ROW_COUNT_POSTGRES_DDL in models.py,
+# which create the same objects on databases built with metadata.create_all().
+# The first statement seeds the counter with the rows that already exist.
+SQLITE_UPGRADE = [
+    "INSERT INTO row_counters (table_name, row_count) SELECT 'properties', count(*) FROM properties",
+    "CREATE TRIGGER IF NOT EXISTS properties_count_ai AFTER INSERT ON properties BEGIN "
+    "UPDATE row_counters SET row_count = row_count + 1 WHERE table_name = 'properties'; END",
+    "CREATE TRIGGER IF NOT EXISTS properties_count_ad AFTER DELETE ON properties BEGIN "
+    "UPDATE row_counters SET row_count = row_count - 1 WHERE table_name = 'properties'; END",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS properties_count_ad",
+    "DROP TRIGGER IF EXISTS properties_count_ai",
+]
+
+POSTGRES_UPGRADE = [
+    "LOCK TABLE properties IN SHARE MODE",
+    "INSERT INTO row_counters (table_name, row_count) SELECT 'properties', count(*) FROM properties",
+    "CREATE OR REPLACE FUNCTION properties_row_count() RETURNS trigger AS $$ BEGIN "
+    "UPDATE row_counters SET row_count = row_count + CASE WHEN TG_OP = 'INSERT' THEN 1 ELSE -1 END "
+    "WHERE table_name = 'properties'; RETURN NULL; END $$ LANGUAGE plpgsql",
+    "CREATE TRIGGER properties_row_count AFTER INSERT OR DELETE ON properties "
+    "FOR EACH ROW EXECUTE FUNCTION properties_row_count()",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS properties_row_count ON properties",
+    "DROP FUNCTION IF EXISTS properties_row_count()",
+]
+
+
+def _run(statements) -> None:
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'row_counters',
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('row_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_UPGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_UPGRADE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_DOWNGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_DOWNGRADE)
+    op.drop_table('row_counters')
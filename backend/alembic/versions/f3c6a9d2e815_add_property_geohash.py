@@ -0,0 +1,45 @@
+"""add property geohash
+
+Revision ID: f3c6a9d2e815
+Revises: e1b5d3a8c742
+Create Date: 2026-10-18 12:41:37.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.geo import point_geohash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c6a9d2e815'
+down_revision: Union[str, None] = 'e1b5d3a8c742'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain ADD COLUMN (no batch mode) so SQLite keeps the FTS triggers on properties
+    op.add_column('properties', sa.Column('geohash', sa.String(length=12), nullable=True))
+    op.create_index(op.f('ix_properties_geohash'), 'properties', ['geohash'], unique=False)
+
+    # Backfill from the existing coordinates
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, latitude, longitude FROM properties WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+    )).fetchall()
+    if rows:
+        conn.execute(
+            sa.text("UPDATE properties SET geohash = :geohash WHERE id = :id"),
+            [{"id": row.id, "geohash": point_geohash(row.latitude, row.longitude)} for row in rows],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_properties_geohash'), table_name='properties')
+    # Native DROP COLUMN (SQLite >= 3.35) rather than a batch table rebuild, which would drop the FTS triggers
+    op.execute(sa.text("ALTER TABLE properties DROP COLUMN geohash"))
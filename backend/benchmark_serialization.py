@@ -0,0 +1,107 @@
+"""Compare the JSON rendering paths for the hot read endpoints.
+
+"pydantic" is what FastAPI does for a route with a response_model: validate
+each ORM object into the schema, run jsonable_encoder, then json.dumps.
+"fast" is core.serializers: precompiled attribute readers plus orjson, as
+used by GET /api/properties/, /api/team/ and /api/settings/.
+
+Both paths render the same already-loaded objects, so the timings isolate
+serialization from the database. The script also checks that both paths
+produce the same JSON, including for URLs that Pydantic's HttpUrl rewrites
+(bare hosts gain a trailing "/", hosts are lowercased and IDNA-encoded).
+
+Usage (from the backend directory, with virtual-env activated):
+
+    python benchmark_serialization.py [--repeat 50] [--limit 100]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from core.serializers import dumps, serialize_many
+from crud.properties import PROPERTY_RELATIONS
+import models
+import schemas
+
+
+def pydantic_path(schema, objects) -> bytes:
+    content = jsonable_encoder([schema.model_validate(obj, from_attributes=True) for obj in objects])
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(schema, objects, fields=None) -> bytes:
+    return dumps(serialize_many(schema, objects, fields))
+
+
+def timed(func, repeat: int) -> float:
+    """Best-of-`repeat` wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def compare(label: str, schema, objects, repeat: int) -> None:
+    slow, fast = pydantic_path(schema, objects), fast_path(schema, objects)
+    same = json.loads(slow) == json.loads(fast)
+    slow_ms = timed(lambda: pydantic_path(schema, objects), repeat)
+    fast_ms = timed(lambda: fast_path(schema, objects), repeat)
+    print(f"== {label} ({len(objects)} rows, {len(fast)} bytes)")
+    print(f"   pydantic + jsonable_encoder: {slow_ms:8.2f} ms")
+    print(f"   precompiled + orjson:        {fast_ms:8.2f} ms   ({slow_ms / fast_ms:.1f}x faster)")
+    print(f"   identical output: {'yes' if same else 'NO'}")
+    print()
+
+
+# Stored URLs whose HttpUrl rendering differs from the stored text
+UNNORMALIZED_URLS = [
+    "http://example.com",
+    "HTTPS://Images.Example.COM/photo.jpg",
+    "https://example.com:443/a b.jpg",
+    "http://café.example/ñ.png",
+]
+
+
+def url_samples() -> list:
+    """Transient properties (with images) carrying UNNORMALIZED_URLS."""
+    return [
+        models.Property(
+            id=index, title=f"URL sample {index}", image_url=url, click_count=0, created_at=datetime(2024, 1, 1),
+            images=[models.PropertyImage(id=index, property_id=index, image_url=url, order=0)],
+        )
+        for index, url in enumerate(UNNORMALIZED_URLS, start=1)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100, help="properties per page")
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        properties = (
+            db.query(models.Property).options(*PROPERTY_RELATIONS)
+            .order_by(models.Property.id).limit(args.limit).all()
+        )
+        compare("properties list", schemas.Property, properties, args.repeat)
+        if properties:
+            compare("property detail", schemas.Property, properties[:1], args.repeat * 10)
+        compare("unnormalized image URLs", schemas.Property, url_samples(), args.repeat)
+        compare("team", schemas.TeamMember, db.query(models.TeamMember).all(), args.repeat)
+        compare("settings", schemas.SiteSetting, db.query(models.SiteSettings).all(), args.repeat)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from .config import settings
+
+# In-process caches for hot public reads. Each worker process holds its own
+# copy; entries expire after `ttl` seconds so writes made through another
+# worker become visible within one TTL, and writes made through this worker
+# clear the caches immediately (see invalidate_property_caches).
+
+_registry: List["TTLCache"] = []
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag over the given version parts (timestamps, counts, normalized parameters)."""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag` (RFC 9110 section 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {cache.name: cache.stats() for cache in _registry}
+
+
+# Anonymous GET /api/properties/ pages, keyed on the normalized query parameters
+property_list_cache = TTLCache(
+    "property_list", settings.PROPERTY_CACHE_SIZE, settings.PROPERTY_CACHE_TTL_SECONDS
+)
+
+# X-Total-Count of GET /api/properties/?include_total=true, keyed on the normalized filters and staff scope
+property_count_cache = TTLCache(
+    "property_count", settings.PROPERTY_CACHE_SIZE, settings.PROPERTY_CACHE_TTL_SECONDS
+)
+
+# GET /api/properties/facets/ results, keyed on the normalized filters and staff scope
+property_facets_cache = TTLCache(
+    "property_facets", settings.PROPERTY_CACHE_SIZE, settings.PROPERTY_CACHE_TTL_SECONDS
+)
+
+# GET /api/properties/clusters/ grid cells, keyed on (zoom, tile x, tile y, staff scope)
+property_clusters_cache = TTLCache(
+    "property_clusters", settings.PROPERTY_CACHE_SIZE, settings.PROPERTY_CACHE_TTL_SECONDS
+)
+
+# Pre-rendered GET /api/properties/featured/ response; a single entry, rebuilt on first read after a write
+property_featured_cache = TTLCache("property_featured", 1, settings.PROPERTY_FEATURED_TTL_SECONDS)
+
+# Rendered GET /api/properties/trending/ responses, keyed on limit; the scores behind them refresh at the same pace
+property_trending_cache = TTLCache("property_trending", 16, settings.TRENDING_REFRESH_SECONDS)
+
+
+def invalidate_property_caches() -> None:
+    """Drop every cached property read; called by CRUDProperty after each write."""
+    property_list_cache.clear()
+    property_count_cache.clear()
+    property_facets_cache.clear()
+    property_clusters_cache.clear()
+    property_featured_cache.clear()
+    property_trending_cache.clear()
@@ -0,0 +1,101 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .config import settings
+
+# Click suppression in front of click ingestion. Browser prefetches, crawlers
+# and other non-human user agents are dropped outright, and a repeat of the
+# same (ip, user agent, property) within the dedupe window, e.g. a refresh, is
+# dropped as a duplicate. Suppressed clicks are counted, not written.
+# Like the caches, the recent-click window is per worker process.
+
+BOT_USER_AGENT = re.compile(
+    r"bot|crawl|spider|slurp|scrap|preview|fetch|monitor|headless|lighthouse|pingdom|"
+    r"facebookexternalhit|whatsapp|embedly|python-requests|python-urllib|aiohttp|httpx|"
+    r"curl|wget|go-http-client|okhttp|java/|libwww|apache-httpclient|postman",
+    re.IGNORECASE,
+)
+
+
+def is_bot(user_agent: Optional[str]) -> bool:
+    """True for a missing user agent or one naming a crawler, link previewer or HTTP library."""
+    return not user_agent or BOT_USER_AGENT.search(user_agent) is not None
+
+
+class ClickFilter:
+    """Windowed dedupe over a bounded LRU of recently recorded (ip, user agent, property) keys, plus bot filtering.
+
+    check() only reads the window; the caller calls remember() once the click
+    has actually been accepted, so a click rejected downstream (full queue,
+    failed write) can be retried without being suppressed as a duplicate.
+    """
+
+    def __init__(self, window_seconds: float, maxsize: int, filter_bots: bool = True):
+        self.window_seconds = window_seconds
+        self.maxsize = maxsize
+        self.filter_bots = filter_bots
+        self._recent: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.passed = 0
+        self.suppressed: Dict[str, int] = {"bot": 0, "prefetch": 0, "duplicate": 0}
+
+    def check(self, property_id: int, ip_address: Optional[str], user_agent: Optional[str], prefetch: bool = False) -> Optional[str]:
+        """The reason to suppress this click ("bot", "prefetch" or "duplicate"), or None to record it."""
+        reason = None
+        if prefetch:
+            reason = "prefetch"
+        elif self.filter_bots and is_bot(user_agent):
+            reason = "bot"
+        elif self.window_seconds > 0 and self._seen_recently(self._key(property_id, ip_address, user_agent)):
+            reason = "duplicate"
+        with self._lock:
+            if reason is None:
+                self.passed += 1
+            else:
+                self.suppressed[reason] += 1
+        return reason
+
+    def remember(self, property_id: int, ip_address: Optional[str], user_agent: Optional[str]) -> None:
+        """Start the dedupe window for a click that has been recorded (or queued)."""
+        if self.window_seconds <= 0:
+            return
+        key = self._key(property_id, ip_address, user_agent)
+        now = time.monotonic()
+        with self._lock:
+            while self._recent:
+                oldest_key, seen_at = next(iter(self._recent.items()))
+                if now - seen_at < self.window_seconds and len(self._recent) < self.maxsize:
+                    break
+                del self._recent[oldest_key]
+            self._recent[key] = now
+            self._recent.move_to_end(key)
+
+    @staticmethod
+    def _key(property_id: int, ip_address: Optional[str], user_agent: Optional[str]) -> bytes:
+        # Fixed-size digest so long user agents do not bloat the window
+        return hashlib.blake2b(f"{property_id}\0{ip_address}\0{user_agent}".encode("utf-8"), digest_size=12).digest()
+
+    def _seen_recently(self, key: bytes) -> bool:
+        with self._lock:
+            seen_at = self._recent.get(key)
+        return seen_at is not None and time.monotonic() - seen_at < self.window_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.passed + sum(self.suppressed.values())
+            return {
+                "window_seconds": self.window_seconds,
+                "tracked_keys": len(self._recent),
+                "passed": self.passed,
+                "suppressed": dict(self.suppressed),
+                "suppressed_rate": round(sum(self.suppressed.values()) / total, 4) if total else None,
+            }
+
+
+click_filter = ClickFilter(
+    settings.CLICK_DEDUPE_WINDOW_SECONDS, settings.CLICK_DEDUPE_MAX_KEYS, settings.CLICK_BOT_FILTER_ENABLED
+)
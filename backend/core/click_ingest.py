@@ -0,0 +1,167 @@
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Buffered click ingestion (CLICK_INGESTION_MODE=buffered). POST .../track-click/
+# checks the property id against an in-memory set and enqueues the click; a
+# background thread writes the queue out in batches with one INSERT and one
+# commit per batch instead of a SELECT, INSERT and commit per click.
+#
+# The queue is per worker process and lives in memory: clicks still queued when
+# a worker is killed without a shutdown are lost. A normal shutdown (lifespan
+# exit) stops the flusher and writes out everything that is left.
+
+Click = Dict[str, Any]
+MAX_FLUSH_ATTEMPTS = 3  # a batch failing this many times in a row is dropped
+
+
+class ClickIngestor:
+    """Bounded click queue drained by a background flusher thread."""
+
+    def __init__(self, maxsize: int, batch_size: int, interval_seconds: float):
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._queue: "queue.Queue[Click]" = queue.Queue(maxsize=maxsize)
+        self._known_ids: Set[int] = set()
+        self._flush: Optional[Callable[[List[Click]], int]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0  # queue full; the client got 503
+        self.written = 0
+        self.discarded = 0  # property deleted before its clicks were written
+        self.dropped = 0  # lost after repeated flush failures
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.last_flush_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, flush: Callable[[List[Click]], int], known_ids: Set[int]) -> None:
+        """Start the flusher. `flush` writes a batch and returns how many clicks it stored."""
+        self._flush = flush
+        self._known_ids = set(known_ids)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="click-flusher", daemon=True)
+        self._thread.start()
+        logger.info(f"Click flusher started ({len(self._known_ids)} known properties).")
+
+    def stop(self) -> None:
+        """Stop the flusher and write out every queued click."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        while not self._queue.empty():
+            self._write(self._take_batch(timeout=0), attempts=MAX_FLUSH_ATTEMPTS)
+        logger.info(f"Click flusher stopped; {self.written} clicks written in total.")
+
+    def is_known(self, property_id: int) -> bool:
+        return property_id in self._known_ids
+
+    def remember(self, property_id: int) -> None:
+        self._known_ids.add(property_id)
+
+    def offer(self, property_id: int, ip_address: Optional[str], user_agent: Optional[str]) -> bool:
+        """Queue a click; False when the queue is full."""
+        click = {
+            "property_id": property_id,
+            "clicked_at": datetime.utcnow(),
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+        try:
+            self._queue.put_nowait(click)
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.accepted += 1
+        return True
+
+    def _take_batch(self, timeout: float) -> List[Click]:
+        """Up to batch_size clicks, waiting at most `timeout` seconds for the batch to fill."""
+        batch = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            try:
+                remaining = deadline - time.monotonic()
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        pending: List[Click] = []
+        attempts = 0
+        while not self._stop.is_set():
+            if not pending:
+                pending = self._take_batch(self.interval_seconds)
+                attempts = 0
+            if not pending:
+                continue
+            attempts += 1
+            if self._write(pending, attempts):
+                pending = []
+            else:
+                self._stop.wait(self.interval_seconds)
+        if pending:
+            self._write(pending, attempts=MAX_FLUSH_ATTEMPTS)
+
+    def _write(self, batch: List[Click], attempts: int) -> bool:
+        """Flush one batch; True when it is done with (written, or dropped after MAX_FLUSH_ATTEMPTS)."""
+        if not batch:
+            return True
+        started = time.perf_counter()
+        try:
+            stored = self._flush(batch)
+        except Exception as e:
+            with self._lock:
+                self.failed_flushes += 1
+                if attempts >= MAX_FLUSH_ATTEMPTS:
+                    self.dropped += len(batch)
+            if attempts >= MAX_FLUSH_ATTEMPTS:
+                logger.error(f"Dropping {len(batch)} clicks after {attempts} failed flushes: {e}", exc_info=True)
+                return True
+            logger.warn(f"Click flush of {len(batch)} rows failed (attempt {attempts}), retrying: {e}")
+            return False
+        with self._lock:
+            self.flushes += 1
+            self.written += stored
+            self.discarded += len(batch) - stored
+            self.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": settings.CLICK_INGESTION_MODE,
+                "running": self.running,
+                "queued": self._queue.qsize(),
+                "capacity": self._queue.maxsize,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "written": self.written,
+                "discarded": self.discarded,
+                "dropped": self.dropped,
+                "flushes": self.flushes,
+                "failed_flushes": self.failed_flushes,
+                "last_flush_ms": self.last_flush_ms,
+            }
+
+
+click_ingestor = ClickIngestor(
+    settings.CLICK_QUEUE_SIZE, settings.CLICK_FLUSH_BATCH_SIZE, settings.CLICK_FLUSH_INTERVAL_MS / 1000
+)
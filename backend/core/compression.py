@@ -0,0 +1,159 @@
+import gzip
+import zlib
+from typing import Dict, Optional, Tuple
+
+from .config import settings
+
+try:
+    import brotli  # Optional; enables "br" when installed
+except ImportError:
+    brotli = None
+
+# Response compression. CompressionMiddleware compresses responses on the way
+# out; endpoints that cache rendered bytes can instead compress once with
+# compress_cached() and send the stored variant, which the middleware passes
+# through untouched because it already carries Content-Encoding.
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/x-ndjson", "application/javascript",
+    "text/", "image/svg+xml",
+)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The best encoding the client accepts: "br" (when available), "gzip", or None."""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_cached(body: bytes, accept_encoding: Optional[str], variants: Dict[str, bytes]) -> Tuple[bytes, Optional[str]]:
+    """(body, Content-Encoding) for a cached body, compressing at most once per encoding.
+
+    `variants` lives in the cache entry next to the uncompressed body and is
+    filled lazily; a concurrent miss at worst compresses the same bytes twice.
+    """
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None or len(body) < settings.COMPRESSION_MIN_SIZE:
+        return body, None
+    compressed = variants.get(encoding)
+    if compressed is None:
+        compressed = variants[encoding] = compress(body, encoding)
+    return compressed, encoding
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+            self.compress = self._compressor.process
+        else:
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip container
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+            self.compress = self._compressor.compress
+
+    def chunk(self, data: bytes, last: bool) -> bytes:
+        # Flush every chunk so streamed rows reach the client as they are produced
+        return self.compress(data) + (self._finish() if last else self._flush())
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses of at least `minimum_size` bytes with br or gzip.
+
+    Skips responses that already have a Content-Encoding, non-text media types
+    and small bodies; streamed responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = dict(scope["headers"])
+        encoding = choose_encoding(request_headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = {key.lower(): value for key, value in start_message["headers"]}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                if (
+                    b"content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                raw_headers = [
+                    (key, value) for key, value in start_message["headers"]
+                    if key.lower() not in (b"content-length", b"vary")
+                ]
+                vary = headers.get(b"vary")
+                raw_headers.append((b"content-encoding", encoding.encode()))
+                if not vary:
+                    vary = b"Accept-Encoding"
+                elif b"accept-encoding" not in vary.lower():
+                    vary += b", Accept-Encoding"
+                raw_headers.append((b"vary", vary))
+                if not more_body:
+                    compressed = compress(body, encoding)
+                    raw_headers.append((b"content-length", str(len(compressed)).encode()))
+                    await send({**start_message, "headers": raw_headers})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                compressor = _StreamCompressor(encoding)
+                await send({**start_message, "headers": raw_headers})
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.chunk(body, last=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
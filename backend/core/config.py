@@ -37,6 +37,42 @@ class Settings(BaseSettings):
     # Upload Directory (if handling uploads locally)
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "backend/static/uploads")
 
+    # In-process cache for anonymous property listings
+    PROPERTY_CACHE_SIZE: int = 256 # Max cached filter combinations per worker (0 disables)
+    PROPERTY_CACHE_TTL_SECONDS: float = 30.0
+    PROPERTY_CACHE_MAX_LIMIT: int = 100 # Pages with a larger ?limit= are not cached, so entries stay small
+    PROPERTY_FEATURED_LIMIT: int = 12 # Cards in the GET /api/properties/featured/ snapshot
+    PROPERTY_FEATURED_TTL_SECONDS: float = 300.0 # Bounds staleness after writes made through other workers
+
+    # Response compression (br when the brotli package is installed, else gzip)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024 # Bytes; smaller responses are sent as-is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+
+    # POST /api/properties/bulk/: rows per INSERT batch (overridable per request with ?batch_size=)
+    PROPERTY_BULK_BATCH_SIZE: int = 500
+
+    # POST /api/properties/{id}/track-click/: "sync" writes each click in the request,
+    # "buffered" queues it in memory (202 Accepted) for a background batch writer
+    CLICK_INGESTION_MODE: str = "sync"
+    CLICK_QUEUE_SIZE: int = 10000 # Per worker; clicks beyond this get 503 until the flusher catches up
+    CLICK_FLUSH_BATCH_SIZE: int = 500 # Max clicks per INSERT
+    CLICK_FLUSH_INTERVAL_MS: int = 500 # Max time a click waits in the queue
+    # Suppress repeats of the same (ip, user agent, property) within this window, and bot/prefetch clicks
+    CLICK_DEDUPE_WINDOW_SECONDS: float = 30.0 # 0 disables the dedupe
+    CLICK_DEDUPE_MAX_KEYS: int = 100000 # Per worker; the oldest keys are forgotten first
+    CLICK_BOT_FILTER_ENABLED: bool = True
+
+    # Background job folding property_clicks into hourly/daily rollups for the stats endpoints
+    CLICK_ROLLUP_INTERVAL_SECONDS: float = 60.0 # 0 disables the job in this worker
+    CLICK_ROLLUP_BATCH_SIZE: int = 10000 # Clicks read per rollup transaction
+
+    # GET /api/properties/trending/: click scores that halve every TRENDING_HALF_LIFE_HOURS
+    TRENDING_HALF_LIFE_HOURS: float = 24.0
+    TRENDING_REFRESH_SECONDS: float = 10.0 # How often new clicks are folded in; 0 disables trending in this worker
+    TRENDING_CHECKPOINT_SECONDS: float = 300.0 # How often scores are saved for restarts
+
     # Email Settings (SMTP)
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: Optional[int] = 587
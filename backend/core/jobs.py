@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Periodic background jobs run on a daemon thread in each worker process,
+# started and stopped from the FastAPI lifespan in main.py. A job given a
+# `lease` only runs while that callable reports this worker holds it (see
+# crud/job_leases.py); its other runs are counted as skipped. Jobs must still
+# be safe to run concurrently (e.g. recompute-and-upsert), since a lease can
+# expire during a run that outlasts it.
+
+_registry: List["PeriodicJob"] = []
+
+
+class PeriodicJob:
+    """Calls `fn` every `interval_seconds` until stopped; a failing run is logged and retried next interval."""
+
+    def __init__(self, name: str, interval_seconds: float, fn: Callable[[], Any], lease: Optional[Callable[[], bool]] = None):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.fn = fn
+        self.lease = lease
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_result: Any = None
+        self.last_error: Optional[str] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"job-{self.name}", daemon=True)
+        self._thread.start()
+        logger.info(f"Job {self.name} started (every {self.interval_seconds}s).")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        logger.info(f"Job {self.name} stopped.")
+
+    def _holds_lease(self) -> bool:
+        try:
+            held = self.lease()
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+                self.last_error = str(e)
+            logger.error(f"Job {self.name} could not check its lease: {e}", exc_info=True)
+            return False
+        if not held:
+            with self._lock:
+                self.skipped += 1
+        return held
+
+    def run_once(self) -> Any:
+        if self.lease is not None and not self._holds_lease():
+            return None
+        started = time.perf_counter()
+        try:
+            result = self.fn()
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+                self.last_error = str(e)
+            logger.error(f"Job {self.name} failed: {e}", exc_info=True)
+            return None
+        finally:
+            with self._lock:
+                self.runs += 1
+                self.last_run_at = datetime.utcnow()
+                self.last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        with self._lock:
+            self.last_result = result
+        return result
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self.running,
+                "interval_seconds": self.interval_seconds,
+                "runs": self.runs,
+                "skipped": self.skipped,
+                "failures": self.failures,
+                "last_run_at": self.last_run_at,
+                "last_duration_ms": self.last_duration_ms,
+                "last_result": self.last_result,
+                "last_error": self.last_error,
+            }
+
+
+def jobs_stats() -> Dict[str, Dict[str, Any]]:
+    return {job.name: job.stats() for job in _registry}
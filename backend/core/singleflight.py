@@ -0,0 +1,78 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+# Request coalescing. When many threadpool workers miss the cache for the same
+# key at once (e.g. a newsletter link), only the first runs the work; the rest
+# wait for its result instead of repeating the same queries and rendering.
+# Like the caches, this is per worker process.
+
+_registry: List["SingleFlight"] = []
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs at most one `fn` per key at a time; concurrent callers with the same key share its outcome."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executions = 0
+        self.coalesced = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = self.executions + self.coalesced
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+                "coalesced_rate": round(self.coalesced / calls, 4) if calls else None,
+            }
+
+
+def singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    return {flight.name: flight.stats() for flight in _registry}
+
+
+# Builds of anonymous GET /api/properties/ pages after a property_list_cache miss
+property_list_flight = SingleFlight("property_list")
+
+# Rebuilds of the featured properties snapshot
+property_featured_flight = SingleFlight("property_featured")
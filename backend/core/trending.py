@@ -0,0 +1,82 @@
+import heapq
+import math
+import threading
+import time
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import settings
+
+# Time-decayed click scores for GET /api/properties/trending/. Every click adds
+# 1 to its property's score, and scores halve every half-life. Instead of
+# decaying every score on every tick, a click at time t adds
+# exp(rate * (t - epoch)); all scores share the same decay factor, so ranking
+# needs no update at all and the current value is the stored one times
+# exp(-rate * (now - epoch)). The epoch is moved forward now and then to keep
+# the numbers finite, dropping scores that have decayed to nothing.
+
+REBASE_EXPONENT = 50.0  # rebase once weights reach e**50
+MIN_SCORE = 1e-3  # scores below this (about 10 half-lives after one click) are dropped on rebase
+
+
+class TrendingScores:
+    def __init__(self, half_life_seconds: float):
+        self.rate = math.log(2) / half_life_seconds
+        self.position = 0  # id of the last property_clicks row folded in
+        self.loaded = False
+        self._epoch = time.time()
+        self._scores: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def _rebase(self, at: float) -> None:
+        factor = math.exp(-self.rate * (at - self._epoch))
+        self._scores = {key: score * factor for key, score in self._scores.items() if score * factor >= MIN_SCORE}
+        self._epoch = at
+
+    def add_clicks(self, clicks: Iterable[Tuple[int, float]], position: int) -> None:
+        """Fold in (property_id, unix time) clicks and advance `position` atomically."""
+        with self._lock:
+            for property_id, at in clicks:
+                exponent = self.rate * (at - self._epoch)
+                if exponent > REBASE_EXPONENT:
+                    self._rebase(at)
+                    exponent = 0.0
+                self._scores[property_id] = self._scores.get(property_id, 0.0) + math.exp(exponent)
+            self.position = max(self.position, position)
+
+    def load(self, scores: Dict[int, float], as_of: float, position: int) -> None:
+        """Replace the state with checkpointed scores valid at `as_of`."""
+        with self._lock:
+            self._epoch = as_of
+            self._scores = dict(scores)
+            self.position = position
+            self.loaded = True
+
+    def _current(self, now: float) -> float:
+        return math.exp(-self.rate * (now - self._epoch))
+
+    def top(self, k: int, now: Optional[float] = None) -> List[Tuple[int, float]]:
+        """The k highest scoring (property_id, current score), best first; O(n log k)."""
+        now = now or time.time()
+        with self._lock:
+            best = heapq.nlargest(k, self._scores.items(), key=itemgetter(1))
+            factor = self._current(now)
+        return [(property_id, score * factor) for property_id, score in best if score * factor >= MIN_SCORE]
+
+    def snapshot(self, now: Optional[float] = None) -> Tuple[Dict[int, float], float, int]:
+        """(scores valid at `now`, now, position) for a checkpoint."""
+        now = now or time.time()
+        with self._lock:
+            factor = self._current(now)
+            scores = {key: score * factor for key, score in self._scores.items() if score * factor >= MIN_SCORE}
+            return scores, now, self.position
+
+    def discard(self, property_id: int) -> None:
+        with self._lock:
+            self._scores.pop(property_id, None)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+trending_scores = TrendingScores(settings.TRENDING_HALF_LIFE_HOURS * 3600)
@@ -0,0 +1,219 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, literal, String
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+import models
+from utils.hyperloglog import HyperLogLog
+
+# Hourly and daily click rollups. The job reads property_clicks past its
+# checkpoint in id order and recomputes every bucket those clicks fall in from
+# the raw log, so rerunning it (or two workers running it at once) only
+# rewrites the same numbers. Reports read property_click_rollups alone.
+#
+# The same pass folds each new click's IP into the HyperLogLog sketch of its
+# property and day. Adding a value twice changes nothing, so reprocessed clicks
+# are harmless there too, and the sketches of any days merge into a
+# unique-visitor estimate for the whole range.
+
+ROLLUP_CHECKPOINT = "property_click_rollups"
+GRANULARITIES = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+ROLLUP_KEY = ["property_id", "granularity", "bucket_start"]
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Rollup buckets are naive UTC; convert aware datetimes (PostgreSQL timestamptz, ?from= with an offset)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def truncate(value: datetime, granularity: str) -> datetime:
+    value = to_utc_naive(value).replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0) if granularity == "day" else value
+
+
+def _bucket_expr(db: Session, granularity: str):
+    clicked_at = models.PropertyClick.clicked_at
+    if db.get_bind().dialect.name == "sqlite":
+        return func.strftime("%Y-%m-%d %H:00:00" if granularity == "hour" else "%Y-%m-%d 00:00:00", clicked_at)
+    return func.date_trunc(granularity, func.timezone("UTC", clicked_at))
+
+
+def _clicked_at_bound(db: Session, value: datetime):
+    if db.get_bind().dialect.name == "sqlite":
+        # Stored text has no fraction for CURRENT_TIMESTAMP defaults; a bound without one compares correctly with both forms
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S"), String)
+    return value.replace(tzinfo=timezone.utc)
+
+
+def upsert(db: Session, model, index_elements: List[str], columns: List[str]):
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else postgresql_insert
+    stmt = insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements, set_={column: stmt.excluded[column] for column in columns}
+    )
+
+
+def _update_visitor_sketches(db: Session, clicks: list) -> None:
+    """Add the IPs of `clicks` to the stored sketches of their (property, day)."""
+    sketches: Dict[Tuple[int, date], HyperLogLog] = {}
+    for click in clicks:
+        if click.ip_address is None or click.clicked_at is None:
+            continue
+        key = (click.property_id, to_utc_naive(click.clicked_at).date())
+        sketches.setdefault(key, HyperLogLog()).add(click.ip_address)
+    if not sketches:
+        return
+    stored = db.execute(
+        select(models.PropertyVisitorSketch.property_id, models.PropertyVisitorSketch.day, models.PropertyVisitorSketch.sketch)
+        .where(
+            models.PropertyVisitorSketch.property_id.in_({property_id for property_id, _day in sketches}),
+            models.PropertyVisitorSketch.day >= min(day for _property_id, day in sketches),
+            models.PropertyVisitorSketch.day <= max(day for _property_id, day in sketches),
+        )
+    )
+    for property_id, day, blob in stored:
+        sketch = sketches.get((property_id, day))
+        if sketch is not None:
+            sketch.merge(HyperLogLog.from_bytes(blob))
+    db.execute(
+        upsert(db, models.PropertyVisitorSketch, ["property_id", "day"], ["sketch"]),
+        [
+            {"property_id": property_id, "day": day, "sketch": sketch.to_bytes()}
+            for (property_id, day), sketch in sketches.items()
+        ]
+    )
+
+
+def rollup_click_batch(db: Session, batch_size: int) -> int:
+    """Fold up to `batch_size` clicks past the checkpoint into the rollups; returns how many were read."""
+    checkpoint = db.get(models.JobCheckpoint, ROLLUP_CHECKPOINT)
+    if checkpoint is None:
+        checkpoint = models.JobCheckpoint(name=ROLLUP_CHECKPOINT, position=0)
+        db.add(checkpoint)
+    clicks = db.execute(
+        select(
+            models.PropertyClick.id, models.PropertyClick.property_id,
+            models.PropertyClick.clicked_at, models.PropertyClick.ip_address,
+        )
+        .where(models.PropertyClick.id > checkpoint.position)
+        .order_by(models.PropertyClick.id)
+        .limit(batch_size)
+    ).all()
+    if not clicks:
+        db.rollback()
+        return 0
+
+    property_ids = {click.property_id for click in clicks}
+    times = [to_utc_naive(click.clicked_at) for click in clicks if click.clicked_at is not None]
+    for granularity, step in GRANULARITIES.items() if times else ():
+        # Only the buckets this batch touched: [first bucket, end of last bucket)
+        bucket = _bucket_expr(db, granularity)
+        rows = db.execute(
+            select(
+                models.PropertyClick.property_id,
+                bucket,
+                func.count(),
+                func.count(func.distinct(models.PropertyClick.ip_address)),
+            )
+            .where(
+                models.PropertyClick.property_id.in_(property_ids),
+                models.PropertyClick.clicked_at >= _clicked_at_bound(db, truncate(min(times), granularity)),
+                models.PropertyClick.clicked_at < _clicked_at_bound(db, truncate(max(times), granularity) + step),
+            )
+            .group_by(models.PropertyClick.property_id, bucket)
+        ).all()
+        values = [
+            {
+                "property_id": property_id,
+                "granularity": granularity,
+                "bucket_start": to_utc_naive(datetime.fromisoformat(bucket_start) if isinstance(bucket_start, str) else bucket_start),
+                "count": count,
+                "unique_ips": unique_ips,
+            }
+            for property_id, bucket_start, count, unique_ips in rows
+        ]
+        if values:
+            db.execute(upsert(db, models.PropertyClickRollup, ROLLUP_KEY, ["count", "unique_ips"]), values)
+    _update_visitor_sketches(db, clicks)
+    checkpoint.position = clicks[-1].id
+    db.commit()
+    return len(clicks)
+
+
+def run_click_rollups(db: Session, batch_size: int = 10000) -> int:
+    """Catch the rollups up with property_clicks; returns the number of clicks processed."""
+    total = 0
+    while True:
+        processed = rollup_click_batch(db, batch_size)
+        total += processed
+        if processed < batch_size:
+            return total
+
+
+def get_property_rollups(
+    db: Session, property_id: int, granularity: str, start: datetime, end: datetime
+) -> List[models.PropertyClickRollup]:
+    return list(db.scalars(
+        select(models.PropertyClickRollup)
+        .where(
+            models.PropertyClickRollup.property_id == property_id,
+            models.PropertyClickRollup.granularity == granularity,
+            models.PropertyClickRollup.bucket_start >= start,
+            models.PropertyClickRollup.bucket_start < end,
+        )
+        .order_by(models.PropertyClickRollup.bucket_start)
+    ))
+
+
+def estimate_unique_visitors(db: Session, property_id: int, start: datetime, end: datetime) -> int:
+    """Estimated distinct visitor IPs over the UTC days overlapping [start, end), from the merged daily sketches."""
+    merged = HyperLogLog()
+    for blob in db.scalars(
+        select(models.PropertyVisitorSketch.sketch).where(
+            models.PropertyVisitorSketch.property_id == property_id,
+            models.PropertyVisitorSketch.day >= start.date(),
+            models.PropertyVisitorSketch.day <= (end - timedelta(microseconds=1)).date(),
+        )
+    ):
+        merged.merge(HyperLogLog.from_bytes(blob))
+    return merged.count()
+
+
+def get_top_properties(
+    db: Session, granularity: str, start: datetime, end: datetime, limit: int = 10
+) -> List[dict]:
+    """Most clicked properties in [start, end), summed over the rollup buckets."""
+    clicks = func.sum(models.PropertyClickRollup.count).label("clicks")
+    top = (
+        select(models.PropertyClickRollup.property_id, clicks)
+        .where(
+            models.PropertyClickRollup.granularity == granularity,
+            models.PropertyClickRollup.bucket_start >= start,
+            models.PropertyClickRollup.bucket_start < end,
+        )
+        .group_by(models.PropertyClickRollup.property_id)
+        .order_by(clicks.desc(), models.PropertyClickRollup.property_id)
+        .limit(limit)
+        .subquery()
+    )
+    rows = db.execute(
+        select(top.c.property_id, models.Property.title, top.c.clicks)
+        .join(models.Property, models.Property.id == top.c.property_id)
+        .order_by(top.c.clicks.desc(), top.c.property_id)
+    ).all()
+    return [{"property_id": property_id, "title": title, "clicks": clicks} for property_id, title, clicks in rows]
+
+
+def stats_range(
+    start: Optional[datetime], end: Optional[datetime], granularity: str, default_days: int = 30
+) -> tuple:
+    """Normalize a requested [start, end) to whole buckets; defaults to the last `default_days` days."""
+    step = GRANULARITIES[granularity]
+    end = truncate(end, granularity) if end else truncate(datetime.utcnow(), granularity) + step
+    start = truncate(start, granularity) if start else end - timedelta(days=default_days)
+    return start, end
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import models
+
+# Leases keep singleton background jobs (click rollups, trending checkpoints)
+# to one worker process at a time across uvicorn workers and hosts, so they do
+# not repeat the same work or contend for the database write lock. A lease is
+# taken, or renewed, in its own short transaction before each run.
+
+
+def acquire_lease(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """Take or renew the lease `name` for `holder` until ttl_seconds from now; False if another holder has it."""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    result = db.execute(
+        update(models.JobLease)
+        .where(
+            models.JobLease.name == name,
+            or_(models.JobLease.holder == holder, models.JobLease.expires_at < now),
+        )
+        .values(holder=holder, expires_at=expires_at)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+    if db.get(models.JobLease, name) is not None:
+        db.rollback()
+        return False
+    db.add(models.JobLease(name=name, holder=holder, expires_at=expires_at))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker created it first
+        db.rollback()
+        return False
+    return True
+
+
+def release_leases(db: Session, holder: str) -> None:
+    """Give up every lease `holder` has, so another worker takes over without waiting for expiry."""
+    db.execute(delete(models.JobLease).where(models.JobLease.holder == holder))
+    db.commit()
@@ -1,17 +1,192 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, Query, selectinload, joinedload, load_only
+from typing import Iterator, List, Optional, Tuple
 import models, schemas
+from core.cache import invalidate_property_caches
+from utils.geo import (bbox_around, geohash_cover, geohash_prefix_upper_bound, km_per_degree, point_geohash, tile_bounds)
+from sqlalchemy import tuple_, table, column, literal_column, text, case, or_, and_, cast, Integer, String, literal, DateTime, insert, select
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
+import base64
+import json
+import re
 import logging
 logger = logging.getLogger(__name__)
 
+# ---------- Full-text search ----------
+# Backed by the properties_fts FTS5 table on SQLite and the search_vector
+# tsvector column on PostgreSQL (see models.PROPERTY_FTS_*_DDL). Databases
+# without either fall back to the old ILIKE scan.
+
+properties_fts = table("properties_fts", column("rowid"))
+_fts_available = {}
+
+
+def _search_tokens(search: str) -> List[str]:
+    return re.findall(r"\w+", search.lower())
+
+
+def _has_fts(db: Session) -> bool:
+    engine = db.get_bind()
+    if engine.url not in _fts_available:
+        dialect = engine.dialect.name
+        if dialect == "sqlite":
+            found = db.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'properties_fts'"
+            )).first()
+        elif dialect == "postgresql":
+            found = db.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'properties' AND column_name = 'search_vector'"
+            )).first()
+        else:
+            found = None
+        _fts_available[engine.url] = found is not None
+        if found is None:
+            logger.warning(f"No full-text index found for dialect '{dialect}'; property search falls back to ILIKE.")
+    return _fts_available[engine.url]
+
+# ---------- Sorting ----------
+# sort name -> (column, ascending). Every sort ends with id in the same
+# direction, so the order is total and each one is served by a (column, id)
+# index (see models.Property.__table_args__). No sort means id order.
+PROPERTY_SORTS = {
+    "price_asc": (models.Property.price, True),
+    "price_desc": (models.Property.price, False),
+    "newest": (models.Property.created_at, False),
+    "largest": (models.Property.square_feet, False),
+    "featured": (models.Property.is_featured, False),
+}
+DEFAULT_SORT = (models.Property.id, True)
+
+# Scalar columns written by the NDJSON/CSV export, in output order
+EXPORT_COLUMNS = [
+    models.Property.id, models.Property.title, models.Property.description, models.Property.price,
+    models.Property.location, models.Property.property_type, models.Property.listing_type,
+    models.Property.status, models.Property.bedrooms, models.Property.bathrooms,
+    models.Property.square_feet, models.Property.image_url, models.Property.latitude,
+    models.Property.longitude, models.Property.is_featured, models.Property.click_count,
+    models.Property.created_at, models.Property.updated_at,
+]
+
+# ---------- Keyset cursors ----------
+# A cursor is an opaque, URL-safe token holding the sort name, sort key and id
+# of the last row of a page. The next page resumes with WHERE (sort_key, id) > (...),
+# so every page costs the same index range scan regardless of depth.
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(sort_value, row_id: int, sort: Optional[str] = None) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    data = {"k": sort_value, "id": row_id}
+    if sort:
+        data["s"] = sort
+    payload = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """(sort name, sort key, id) from a cursor made by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return payload.get("s"), payload["k"], int(payload["id"])
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _cursor_bound(db: Session, sort_col, value):
+    """The cursor's sort key as a bind parameter comparable with `sort_col`."""
+    if value is None or not isinstance(sort_col.type, DateTime):
+        return value
+    try:
+        value = datetime.fromisoformat(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor value: {value!r}") from e
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite compares the stored text: CURRENT_TIMESTAMP defaults have no
+        # fraction, ORM-written values have six digits. Bind the matching form.
+        fmt = "%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"
+        return literal(value.strftime(fmt), String)
+    return value
+
+
+def _keyset_after(db: Session, sort_col, ascending: bool, last_value, last_id: int):
+    """WHERE clause for the rows after (last_value, last_id) in ORDER BY sort_col, id.
+
+    NULL sort keys come first in ascending order on SQLite and last on
+    PostgreSQL (and the reverse for descending), so those rows are placed
+    accordingly rather than dropped by the row-value comparison.
+    """
+    prop_id = models.Property.id
+    nulls_first = ascending if db.get_bind().dialect.name == "sqlite" else not ascending
+    if last_value is None:
+        after = and_(sort_col.is_(None), prop_id > last_id if ascending else prop_id < last_id)
+        return or_(after, sort_col.isnot(None)) if nulls_first else after
+    key, bound = tuple_(sort_col, prop_id), tuple_(_cursor_bound(db, sort_col, last_value), last_id)
+    after = key > bound if ascending else key < bound
+    return after if nulls_first else or_(after, sort_col.is_(None))
+
+# ---------- Geo ----------
+DEFAULT_RADIUS_KM = 10.0  # used when `near` is given without `radius_km`
+CLUSTER_GRID_SIZE = 4  # each map tile is clustered into a CLUSTER_GRID_SIZE x CLUSTER_GRID_SIZE grid
+
+# ---------- Facets ----------
+# Histogram edges for the search sidebar. Bucket i covers [edges[i-1], edges[i]);
+# the first and last buckets are open-ended.
+FACET_PRICE_EDGES = [500, 1000, 2500, 5000, 10000, 50000, 100000, 250000, 500000, 1000000]
+FACET_AREA_EDGES = [50, 100, 150, 250, 500, 1000, 2500]
+FACET_MAX_BEDROOMS = 5   # "5+" bucket
+FACET_MAX_BATHROOMS = 4  # "4+" bucket
+
+
+def _bucket_expr(col, edges: List[float]):
+    return case(
+        (col.is_(None), None),
+        *[(col < edge, index) for index, edge in enumerate(edges)],
+        else_=len(edges),
+    )
+
+
+def _histogram(counts: dict, edges: List[float]) -> List[dict]:
+    bounds = [None] + list(edges) + [None]
+    return [
+        {"min": bounds[index], "max": bounds[index + 1], "count": counts.get(index, 0)}
+        for index in range(len(edges) + 1)
+    ]
+
+
+def _capped_counts(counts: dict, cap: int) -> dict:
+    return {(f"{value}+" if value >= cap else str(value)): count for value, count in sorted(counts.items())}
+
 # ---------- Property CRUD ----------
 
+# Relationships serialized by schemas.Property, loaded in bulk: one extra
+# SELECT ... IN for all images of a page, and the users joined into the main query.
+PROPERTY_RELATIONS = (
+    selectinload(models.Property.images),
+    joinedload(models.Property.assigned_to),
+    joinedload(models.Property.created_by),
+)
+PROPERTY_RELATION_LOADERS = {
+    "images": selectinload(models.Property.images),
+    "assigned_to": joinedload(models.Property.assigned_to),
+    "created_by": joinedload(models.Property.created_by),
+}
+
+
+def projection_options(fields: Tuple[str, ...], *extra_columns) -> list:
+    """Loader options that SELECT only the columns and relationships named in `fields` (plus `extra_columns`)."""
+    columns = [getattr(models.Property, name) for name in fields if name not in PROPERTY_RELATION_LOADERS]
+    return [load_only(models.Property.id, *columns, *extra_columns)] + [
+        PROPERTY_RELATION_LOADERS[name] for name in fields if name in PROPERTY_RELATION_LOADERS
+    ]
+
 class CRUDProperty:
-    def get_properties(
+    def filtered_query(
         self, db: Session,
-        skip: int = 0,
-        limit: int = 20,
         search: Optional[str] = None,
         property_type: Optional[str] = None,
         listing_type: Optional[str] = None,
@@ -23,23 +198,18 @@ class CRUDProperty:
         max_bathrooms: Optional[int] = None,
         min_area: Optional[float] = None,
         max_area: Optional[float] = None,
-        current_user: Optional[models.User] = None
-    ) -> List[models.Property]:
-        log_call_details = (
-            f"get_properties called with skip={skip}, limit={limit}, search='{search}', "
-            f"property_type='{property_type}', listing_type='{listing_type}', "
-            f"min_price={min_price}, max_price={max_price}, "
-            f"min_bedrooms={min_bedrooms}, max_bedrooms={max_bedrooms}, "
-            f"min_bathrooms={min_bathrooms}, max_bathrooms={max_bathrooms}, "
-            f"min_area={min_area}, max_area={max_area}"
-        )
-        logger.info(log_call_details)
-        
-        user_info = "Public user (Unauthenticated)"
-        if current_user:
-            user_info = f"User '{current_user.username}' (Role: {current_user.role.value if current_user.role else 'N/A'})"
-        logger.info(f"Request context: {user_info}")
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        current_user: Optional[models.User] = None,
+        ranked: bool = False
+    ) -> Query:
+        """Build the filtered, unpaged property query shared by the listing endpoints.
 
+        ``bbox`` is (min_lat, min_lng, max_lat, max_lng) and ``near`` is (lat, lng).
+        With ``ranked``, rows are ordered by distance from ``near`` and then by
+        full-text rank of ``search``, when those filters are given.
+        """
         query = db.query(models.Property)
 
         if current_user:
@@ -53,9 +223,12 @@ class CRUDProperty:
             #     logger.info(f"User {current_user.username} (Role: {current_user.role.value}) - no specific user-based query adjustments other than general filters.")
                 
         # Standard filters applicable to all (public and authenticated)
+        if bbox:
+            query = self._apply_bbox(query, bbox)
+        if near:
+            query = self._apply_near(query, near, radius_km or DEFAULT_RADIUS_KM, ranked)
         if search:
-            ilike = f"%{search}%"
-            query = query.filter(models.Property.title.ilike(ilike) | models.Property.location.ilike(ilike))
+            query = self._apply_search(db, query, search, ranked)
         if property_type:
             query = query.filter(models.Property.property_type == property_type)
         if listing_type:
@@ -76,13 +249,139 @@ class CRUDProperty:
             query = query.filter(models.Property.square_feet >= min_area)
         if max_area is not None:
             query = query.filter(models.Property.square_feet <= max_area)
+        return query
+
+    def _apply_bbox(self, query: Query, bbox: Tuple[float, float, float, float]) -> Query:
+        min_lat, min_lng, max_lat, max_lng = bbox
+        # Coarse filter: geohash range scans over the cells covering the box ...
+        cells = geohash_cover(min_lat, min_lng, max_lat, max_lng)
+        query = query.filter(or_(*[
+            and_(models.Property.geohash >= cell, models.Property.geohash < geohash_prefix_upper_bound(cell))
+            for cell in cells
+        ]))
+        # ... then the exact box
+        return query.filter(
+            models.Property.latitude.between(min_lat, max_lat),
+            models.Property.longitude.between(min_lng, max_lng),
+        )
+
+    def _apply_near(self, query: Query, near: Tuple[float, float], radius_km: float, ranked: bool) -> Query:
+        lat, lng = near
+        query = self._apply_bbox(query, bbox_around(lat, lng, radius_km))
+        # Squared equirectangular distance in km: plain arithmetic, portable across SQLite and PostgreSQL
+        ky, kx = km_per_degree(lat)
+        dy = (models.Property.latitude - lat) * ky
+        dx = (models.Property.longitude - lng) * kx
+        distance_sq = dy * dy + dx * dx
+        query = query.filter(distance_sq <= radius_km * radius_km)
+        if ranked:
+            query = query.order_by(distance_sq)
+        return query
 
-        properties_returned = query.offset(skip).limit(limit).all()
+    def _apply_search(self, db: Session, query: Query, search: str, ranked: bool) -> Query:
+        tokens = _search_tokens(search)
+        if not tokens:
+            return query
+        if not _has_fts(db):
+            ilike = f"%{search}%"
+            return query.filter(
+                models.Property.title.ilike(ilike)
+                | models.Property.location.ilike(ilike)
+                | models.Property.description.ilike(ilike)
+            )
+
+        if db.get_bind().dialect.name == "sqlite":
+            # Prefix match on every token, e.g. 'casa alta' -> "casa"* "alta"*
+            match = " ".join(f'"{token}"*' for token in tokens)
+            query = query.join(properties_fts, properties_fts.c.rowid == models.Property.id)
+            query = query.filter(literal_column("properties_fts").op("MATCH")(match))
+            if ranked:
+                # bm25 is lower-is-better; weights favour title, then location, then description
+                query = query.order_by(func.bm25(literal_column("properties_fts"), 10.0, 5.0, 1.0))
+        else:
+            tsquery = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+            search_vector = literal_column("properties.search_vector")
+            query = query.filter(search_vector.op("@@")(tsquery))
+            if ranked:
+                query = query.order_by(func.ts_rank(search_vector, tsquery).desc())
+        return query
+
+    def get_properties(
+        self, db: Session,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+        property_type: Optional[str] = None,
+        listing_type: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_bedrooms: Optional[int] = None,
+        max_bedrooms: Optional[int] = None,
+        min_bathrooms: Optional[int] = None,
+        max_bathrooms: Optional[int] = None,
+        min_area: Optional[float] = None,
+        max_area: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        sort: Optional[str] = None,
+        fields: Optional[Tuple[str, ...]] = None,
+        current_user: Optional[models.User] = None
+    ) -> List[models.Property]:
+        log_call_details = (
+            f"get_properties called with skip={skip}, limit={limit}, cursor={cursor!r}, sort={sort}, fields={fields}, search='{search}', "
+            f"property_type='{property_type}', listing_type='{listing_type}', "
+            f"min_price={min_price}, max_price={max_price}, "
+            f"min_bedrooms={min_bedrooms}, max_bedrooms={max_bedrooms}, "
+            f"min_bathrooms={min_bathrooms}, max_bathrooms={max_bathrooms}, "
+            f"min_area={min_area}, max_area={max_area}, "
+            f"bbox={bbox}, near={near}, radius_km={radius_km}"
+        )
+        logger.info(log_call_details)
+        
+        user_info = "Public user (Unauthenticated)"
+        if current_user:
+            user_info = f"User '{current_user.username}' (Role: {current_user.role.value if current_user.role else 'N/A'})"
+        logger.info(f"Request context: {user_info}")
+
+        query = self.filtered_query(
+            db, search=search, property_type=property_type, listing_type=listing_type,
+            min_price=min_price, max_price=max_price,
+            min_bedrooms=min_bedrooms, max_bedrooms=max_bedrooms,
+            min_bathrooms=min_bathrooms, max_bathrooms=max_bathrooms,
+            min_area=min_area, max_area=max_area,
+            bbox=bbox, near=near, radius_km=radius_km, current_user=current_user,
+            # Distance and relevance ranking are not keyset-pageable, so cursor pages keep the keyset order
+            ranked=self.is_ranked(search=search, near=near, sort=sort) and not cursor
+        )
+
+        if fields is None:
+            query = query.options(*PROPERTY_RELATIONS)
+        else:
+            # Sparse fieldset; the sort column is loaded too because next_cursor reads it
+            query = query.options(*projection_options(fields, PROPERTY_SORTS.get(sort, DEFAULT_SORT)[0]))
+
+        query = self._apply_sort(query, sort)
+        if cursor:
+            # Cursor mode: resume after the last row of the previous page; skip is ignored.
+            cursor_sort, last_value, last_id = decode_cursor(cursor)
+            if cursor_sort != sort:
+                raise InvalidCursorError(f"Cursor was issued for sort={cursor_sort!r}, not sort={sort!r}")
+            sort_col, ascending = PROPERTY_SORTS.get(sort, DEFAULT_SORT)
+            query = query.filter(_keyset_after(db, sort_col, ascending, last_value, last_id))
+            properties_returned = query.limit(limit).all()
+        else:
+            properties_returned = query.offset(skip).limit(limit).all()
         
         logger.info(f"{user_info} - Query resulted in {len(properties_returned)} properties being returned (after offset/limit):")
         if not properties_returned:
             logger.info("  No properties matched the criteria.")
         for prop in properties_returned:
+            if fields is not None:
+                # Reading unloaded columns here would lazy-load them one row at a time
+                logger.info(f"  - ID: {prop.id} (fields: {', '.join(fields)})")
+                continue
             logger.info(
                 f"  - ID: {prop.id}, Title: '{prop.title}', Status: '{prop.status}', "
                 f"Price: {prop.price}, Bedrooms: {prop.bedrooms}, Location: '{prop.location}', "
@@ -92,8 +391,183 @@ class CRUDProperty:
             
         return properties_returned
 
-    def get_property(self, db: Session, property_id: int) -> Optional[models.Property]:
-        return db.query(models.Property).filter(models.Property.id == property_id).first()
+    def _apply_sort(self, query: Query, sort: Optional[str]) -> Query:
+        # Keyset order: the sort column (the primary key by default), with id as the tiebreaker.
+        sort_col, ascending = PROPERTY_SORTS.get(sort, DEFAULT_SORT)
+        if ascending:
+            return query.order_by(sort_col.asc(), models.Property.id.asc())
+        return query.order_by(sort_col.desc(), models.Property.id.desc())
+
+    def iter_export_rows(
+        self, db: Session, current_user: Optional[models.User] = None, sort: Optional[str] = None,
+        batch_size: int = 1000, **filters
+    ) -> Iterator[dict]:
+        """Yield every matching property as a dict of EXPORT_COLUMNS, in `sort` order.
+
+        Rows are fetched through a server-side cursor `batch_size` at a time and
+        no ORM objects are built, so memory stays flat whatever the catalogue size.
+        """
+        query = self.filtered_query(db, current_user=current_user, **filters)
+        query = self._apply_sort(query, sort).with_entities(*EXPORT_COLUMNS)
+        names = [col.key for col in EXPORT_COLUMNS]
+        result = db.execute(query.statement.execution_options(yield_per=batch_size))
+        for row in result:
+            yield dict(zip(names, row))
+
+    def is_ranked(
+        self, search: Optional[str] = None, near: Optional[Tuple[float, float]] = None,
+        sort: Optional[str] = None, **_filters
+    ) -> bool:
+        """Whether a listing is ordered by distance or relevance instead of the keyset order.
+
+        An explicit ``sort`` takes precedence over both.
+        """
+        return bool(search or near) and not sort
+
+    def next_cursor(self, properties: List[models.Property], limit: int, **filters) -> Optional[str]:
+        """Cursor for the page after `properties`, or None when this page was the last one.
+
+        Ranked results (search relevance, distance) are paged with skip/limit, so they get no cursor.
+        """
+        if self.is_ranked(**filters) or not properties or len(properties) < limit:
+            return None
+        sort = filters.get("sort")
+        sort_col, _ascending = PROPERTY_SORTS.get(sort, DEFAULT_SORT)
+        last = properties[-1]
+        return encode_cursor(getattr(last, sort_col.key), last.id, sort)
+
+    def get_facets(self, db: Session, current_user: Optional[models.User] = None, **filters) -> dict:
+        """Sidebar counts for a filter set, computed in one grouped pass over the filtered rows.
+
+        The query groups by every facet dimension at once; the (small) set of
+        combinations is then folded into per-dimension counts here.
+        """
+        prop = models.Property
+        bedrooms = case((prop.bedrooms >= FACET_MAX_BEDROOMS, FACET_MAX_BEDROOMS), else_=prop.bedrooms)
+        bathrooms = case((prop.bathrooms >= FACET_MAX_BATHROOMS, FACET_MAX_BATHROOMS), else_=prop.bathrooms)
+        price_bucket = _bucket_expr(prop.price, FACET_PRICE_EDGES)
+        area_bucket = _bucket_expr(prop.square_feet, FACET_AREA_EDGES)
+        dimensions = [prop.property_type, prop.listing_type, prop.status, bedrooms, bathrooms, price_bucket, area_bucket]
+
+        rows = (
+            self.filtered_query(db, current_user=current_user, **filters)
+            .with_entities(*dimensions, func.count(prop.id))
+            .group_by(*dimensions)
+            .all()
+        )
+
+        names = ["property_type", "listing_type", "status", "bedrooms", "bathrooms", "price", "area"]
+        counts = {name: {} for name in names}
+        total = 0
+        for row in rows:
+            count = row[-1]
+            total += count
+            for name, value in zip(names, row[:-1]):
+                if value is not None:
+                    counts[name][value] = counts[name].get(value, 0) + count
+
+        return {
+            "total": total,
+            "property_type": counts["property_type"],
+            "listing_type": counts["listing_type"],
+            "status": counts["status"],
+            "bedrooms": _capped_counts(counts["bedrooms"], FACET_MAX_BEDROOMS),
+            "bathrooms": _capped_counts(counts["bathrooms"], FACET_MAX_BATHROOMS),
+            "price": _histogram(counts["price"], FACET_PRICE_EDGES),
+            "area": _histogram(counts["area"], FACET_AREA_EDGES),
+        }
+
+    def get_tile_clusters(
+        self, db: Session, zoom: int, x: int, y: int, current_user: Optional[models.User] = None
+    ) -> List[dict]:
+        """Grid-cell clusters (centroid, count, price range) for one map tile, in a single GROUP BY."""
+        prop = models.Property
+        min_lat, min_lng, max_lat, max_lng = tile_bounds(zoom, x, y)
+        cell_height = (max_lat - min_lat) / CLUSTER_GRID_SIZE
+        cell_width = (max_lng - min_lng) / CLUSTER_GRID_SIZE
+
+        query = self.filtered_query(db, bbox=(min_lat, min_lng, max_lat, max_lng), current_user=current_user)
+        # Tiles are half-open so a property on a shared edge is counted once
+        if max_lat < 90.0:
+            query = query.filter(prop.latitude < max_lat)
+        if max_lng < 180.0:
+            query = query.filter(prop.longitude < max_lng)
+
+        # Offsets are non-negative inside the tile, so SQLite's truncating CAST is a floor
+        floor = func.floor if db.get_bind().dialect.name == "postgresql" else (lambda expr: cast(expr, Integer))
+        row = floor((prop.latitude - min_lat) / cell_height)
+        col = floor((prop.longitude - min_lng) / cell_width)
+        rows = (
+            query.with_entities(
+                func.count(prop.id), func.avg(prop.latitude), func.avg(prop.longitude),
+                func.min(prop.price), func.max(prop.price),
+            )
+            .group_by(row, col)
+            .all()
+        )
+        return [
+            {
+                "latitude": float(lat), "longitude": float(lng), "count": count,
+                "min_price": min_price, "max_price": max_price,
+            }
+            for count, lat, lng, min_price, max_price in rows
+        ]
+
+    def count_properties(self, db: Session, current_user: Optional[models.User] = None, **filters) -> int:
+        """Number of properties matching the listing filters (paging, sort and fields are ignored)."""
+        filters = {name: value for name, value in filters.items() if name not in ("skip", "limit", "cursor", "sort", "fields")}
+        scoped = current_user is not None and current_user.role == models.Role.staff
+        if not scoped and not any(value is not None for value in filters.values()):
+            # Unfiltered: the trigger-maintained counter, a primary key lookup instead of a scan
+            counter = db.get(models.RowCounter, "properties")
+            if counter is not None:
+                return counter.row_count
+        return self.filtered_query(db, current_user=current_user, **filters).with_entities(
+            func.count(models.Property.id)
+        ).scalar()
+
+    def get_property_version(self, db: Session, property_id: int) -> Optional[tuple]:
+        """(id, last change time, click count) for one property, or None if it does not exist."""
+        row = db.query(
+            models.Property.id,
+            func.coalesce(models.Property.updated_at, models.Property.created_at),
+            models.Property.click_count,
+        ).filter(models.Property.id == property_id).first()
+        return tuple(row) if row else None
+
+    def get_property(
+        self, db: Session, property_id: int, fields: Optional[Tuple[str, ...]] = None
+    ) -> Optional[models.Property]:
+        return (
+            db.query(models.Property)
+            .options(*(PROPERTY_RELATIONS if fields is None else projection_options(fields)))
+            .filter(models.Property.id == property_id)
+            .first()
+        )
+
+    def property_exists(self, db: Session, property_id: int) -> bool:
+        return db.scalar(select(models.Property.id).where(models.Property.id == property_id)) is not None
+
+    def get_property_ids(self, db: Session) -> List[int]:
+        return list(db.scalars(select(models.Property.id)))
+
+    def get_properties_by_ids(self, db: Session, property_ids: List[int]) -> List[models.Property]:
+        """Load several properties in one IN query, returned in the order of `property_ids`; unknown ids are left out."""
+        if not property_ids:
+            return []
+        found = {
+            prop.id: prop
+            for prop in db.query(models.Property)
+            .options(*PROPERTY_RELATIONS)
+            .filter(models.Property.id.in_(property_ids))
+        }
+        return [found[property_id] for property_id in property_ids if property_id in found]
+
+    def get_featured_properties(self, db: Session, limit: int, fields: Optional[Tuple[str, ...]] = None) -> List[models.Property]:
+        """Featured properties, most recently added first (served by ix_properties_is_featured_id)."""
+        query = db.query(models.Property).filter(models.Property.is_featured.is_(True))
+        query = query.options(*(projection_options(fields) if fields else PROPERTY_RELATIONS))
+        return query.order_by(models.Property.id.desc()).limit(limit).all()
 
     def create_property(self, db: Session, property_in: schemas.PropertyCreate, current_user: models.User) -> models.Property:
         property_data = property_in.dict(exclude_unset=True, exclude={'additional_image_urls', 'assigned_to_id', 'created_by_user_id'})
@@ -122,9 +596,62 @@ class CRUDProperty:
                 db.add(prop_image)
         
         db.commit()
+        invalidate_property_caches()
         db.refresh(new_prop)
         return new_prop
 
+    def bulk_insert_properties(
+        self, db: Session, rows: List[Tuple[int, schemas.PropertyCreate]], current_user: models.User
+    ) -> Tuple[List[int], List[dict]]:
+        """Insert one batch of validated rows with two executemany INSERTs (properties, then images).
+
+        `rows` are (row number, property) pairs. Nothing is committed, so a whole
+        import can run in one transaction; call finish_bulk_import at the end.
+        Returns the new ids in input order and the rows rejected, as
+        {"row": n, "errors": [...]}.
+        """
+        is_staff = current_user.role == models.Role.staff
+        errors = []
+        assignees = {prop.assigned_to_id for _, prop in rows if prop.assigned_to_id is not None}
+        known_users = set()
+        if assignees and not is_staff:
+            known_users = set(db.scalars(select(models.User.id).where(models.User.id.in_(assignees))))
+
+        records, accepted = [], []
+        for row_number, prop in rows:
+            # Same assignment rules as create_property
+            assigned_to_id = current_user.id if is_staff else prop.assigned_to_id
+            if assigned_to_id is not None and not is_staff and assigned_to_id not in known_users:
+                errors.append({"row": row_number, "errors": [f"assigned_to_id: user {assigned_to_id} not found"]})
+                continue
+            record = prop.dict(exclude={'additional_image_urls', 'assigned_to_id', 'created_by_user_id'})
+            if record['image_url'] is not None:
+                record['image_url'] = str(record['image_url'])
+            record['assigned_to_id'] = assigned_to_id
+            record['created_by_user_id'] = current_user.id
+            # Core inserts bypass the ORM flush events that maintain geohash
+            record['geohash'] = point_geohash(prop.latitude, prop.longitude)
+            records.append(record)
+            accepted.append(prop)
+        if not records:
+            return [], errors
+
+        ids = db.execute(
+            insert(models.Property).returning(models.Property.id, sort_by_parameter_order=True), records
+        ).scalars().all()
+        images = [
+            {"property_id": prop_id, "image_url": str(image_url), "order": order_idx}
+            for prop_id, prop in zip(ids, accepted)
+            for order_idx, image_url in enumerate(prop.additional_image_urls or [])
+        ]
+        if images:
+            db.execute(insert(models.PropertyImage), images)
+        return list(ids), errors
+
+    def finish_bulk_import(self, db: Session) -> None:
+        db.commit()
+        invalidate_property_caches()
+
     def update_property(self, db: Session, db_prop: models.Property, property_update: schemas.PropertyUpdate) -> models.Property:
         if property_update.delete_image_ids:
             images_to_delete = db.query(models.PropertyImage).filter(
@@ -156,14 +683,31 @@ class CRUDProperty:
             
         for field, value in update_data.items():
             setattr(db_prop, field, value)
+        # Touch the row even when only images changed, so ETags built from updated_at move on.
+        # Set in Python: SQLite's CURRENT_TIMESTAMP has one-second resolution, too coarse for back-to-back edits.
+        db_prop.updated_at = datetime.now(timezone.utc)
         
         db.add(db_prop)
         db.commit()
+        invalidate_property_caches()
         db.refresh(db_prop)
         return db_prop
 
     def delete_property(self, db: Session, db_prop: models.Property):
+        db.query(models.PropertyClick).filter(
+            models.PropertyClick.property_id == db_prop.id
+        ).delete(synchronize_session=False)
+        db.query(models.PropertyClickRollup).filter(
+            models.PropertyClickRollup.property_id == db_prop.id
+        ).delete(synchronize_session=False)
+        db.query(models.PropertyVisitorSketch).filter(
+            models.PropertyVisitorSketch.property_id == db_prop.id
+        ).delete(synchronize_session=False)
+        db.query(models.PropertyTrendingScore).filter(
+            models.PropertyTrendingScore.property_id == db_prop.id
+        ).delete(synchronize_session=False)
         db.delete(db_prop)
         db.commit()
+        invalidate_property_caches()
 
 property = CRUDProperty() 
\ No newline at end of file
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import update, insert, bindparam, select
 import models, schemas
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 def create_property_click(db: Session, property_id: int, ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> models.PropertyClick:
     """
@@ -14,10 +15,49 @@ def create_property_click(db: Session, property_id: int, ip_address: Optional[st
         user_agent=user_agent
     )
     db.add(db_property_click)
+    # Keep the denormalized counter in step; leave updated_at alone since a click is not an edit.
+    db.execute(
+        update(models.Property)
+        .where(models.Property.id == property_id)
+        .values(click_count=models.Property.click_count + 1, updated_at=models.Property.updated_at)
+    )
     db.commit()
     db.refresh(db_property_click)
     return db_property_click
 
-# Optional: A function to get clicks for a property (example)
-# def get_property_clicks(db: Session, property_id: int, skip: int = 0, limit: int = 100) -> list[models.PropertyClick]:
-#     return db.query(models.PropertyClick).filter(models.PropertyClick.property_id == property_id).offset(skip).limit(limit).all() 
\ No newline at end of file
+def record_clicks(db: Session, clicks: List[Dict[str, Any]]) -> int:
+    """
+    Bulk-writes queued clicks (dicts of PropertyClick columns) with one INSERT and one commit.
+    Clicks for properties deleted in the meantime are skipped; returns how many were stored.
+    """
+    property_ids = {click["property_id"] for click in clicks}
+    existing = set(db.scalars(select(models.Property.id).where(models.Property.id.in_(property_ids))))
+    clicks = [click for click in clicks if click["property_id"] in existing]
+    if not clicks:
+        return 0
+    db.execute(insert(models.PropertyClick), clicks)
+    counts: Dict[int, int] = {}
+    for click in clicks:
+        counts[click["property_id"]] = counts.get(click["property_id"], 0) + 1
+    properties = models.Property.__table__
+    db.execute(
+        update(properties)
+        .where(properties.c.id == bindparam("b_id"))
+        .values(click_count=properties.c.click_count + bindparam("b_count"), updated_at=properties.c.updated_at),
+        [{"b_id": property_id, "b_count": count} for property_id, count in counts.items()]
+    )
+    db.commit()
+    return len(clicks)
+
+def get_property_clicks(db: Session, property_id: int, skip: int = 0, limit: int = 100) -> List[models.PropertyClick]:
+    """
+    Returns a page of a property's click history, newest first.
+    """
+    return (
+        db.query(models.PropertyClick)
+        .filter(models.PropertyClick.property_id == property_id)
+        .order_by(models.PropertyClick.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    ) 
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+import models
+from core.trending import TrendingScores
+from crud.click_rollups import to_utc_naive, upsert
+
+# Feeds core.trending from property_clicks and checkpoints it. Every worker
+# tails the same click log past its own position, so all workers converge on
+# the same scores whichever of them served the clicks; the checkpoint lets a
+# restarted worker resume from there instead of replaying the whole log.
+
+TRENDING_CHECKPOINT = "property_trending"
+
+
+def _timestamp(value: datetime) -> float:
+    return to_utc_naive(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+def load_trending_checkpoint(db: Session, scores: TrendingScores) -> None:
+    checkpoint = db.get(models.JobCheckpoint, TRENDING_CHECKPOINT)
+    rows = db.execute(select(models.PropertyTrendingScore)).scalars().all()
+    if checkpoint is None or not rows:
+        scores.load({}, datetime.now(timezone.utc).timestamp(), checkpoint.position if checkpoint else 0)
+        return
+    as_of = _timestamp(rows[0].scored_at)
+    scores.load({row.property_id: row.score for row in rows}, as_of, checkpoint.position)
+
+
+def fold_new_clicks(db: Session, scores: TrendingScores, batch_size: int = 10000) -> int:
+    """Add clicks written since the last call to the in-memory scores; returns how many were folded in."""
+    total = 0
+    while True:
+        clicks = db.execute(
+            select(models.PropertyClick.id, models.PropertyClick.property_id, models.PropertyClick.clicked_at)
+            .where(models.PropertyClick.id > scores.position)
+            .order_by(models.PropertyClick.id)
+            .limit(batch_size)
+        ).all()
+        if not clicks:
+            return total
+        scores.add_clicks(
+            ((click.property_id, _timestamp(click.clicked_at)) for click in clicks if click.clicked_at is not None),
+            clicks[-1].id,
+        )
+        total += len(clicks)
+        if len(clicks) < batch_size:
+            return total
+
+
+def save_trending_checkpoint(db: Session, scores: TrendingScores) -> int:
+    """Persist the current scores and position; returns how many scores were written."""
+    snapshot, as_of, position = scores.snapshot()
+    scored_at = datetime.fromtimestamp(as_of, timezone.utc).replace(tzinfo=None)
+    db.execute(delete(models.PropertyTrendingScore).where(models.PropertyTrendingScore.property_id.not_in(list(snapshot))))
+    if snapshot:
+        db.execute(
+            upsert(db, models.PropertyTrendingScore, ["property_id"], ["score", "scored_at"]),
+            [{"property_id": property_id, "score": score, "scored_at": scored_at} for property_id, score in snapshot.items()]
+        )
+    checkpoint = db.get(models.JobCheckpoint, TRENDING_CHECKPOINT)
+    if checkpoint is None:
+        db.add(models.JobCheckpoint(name=TRENDING_CHECKPOINT, position=position))
+    else:
+        checkpoint.position = position
+    db.commit()
+    return len(snapshot)
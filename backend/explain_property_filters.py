@@ -0,0 +1,95 @@
+"""Print the query plan of the property listing queries for the common filter
+combinations, and which index each one uses.
+
+The queries are generated by ``CRUDProperty.filtered_query`` exactly as
+``GET /api/properties/`` builds them, so the output reflects what production
+traffic runs against the current database (SQLite or PostgreSQL).
+
+Usage (from the backend directory, with virtual-env activated):
+
+    python explain_property_filters.py
+
+On SQLite, run ``ANALYZE`` once on a populated database first so the planner
+has statistics to choose between the composite indexes.
+"""
+
+import re
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+import models
+from crud import property as crud_property
+
+# ---------------------------------------------------------------------------
+# Filter combinations to explain – mirrors the public search sidebar
+# ---------------------------------------------------------------------------
+FILTER_SETS: list[tuple[str, dict]] = [
+    ("no filters", {}),
+    ("listing_type", {"listing_type": "Venta"}),
+    ("listing_type + property_type", {"listing_type": "Venta", "property_type": "Apartamento"}),
+    ("listing_type + property_type + price", {
+        "listing_type": "Venta", "property_type": "Apartamento", "min_price": 100000, "max_price": 300000,
+    }),
+    ("property_type + price", {"property_type": "Casa", "max_price": 400000}),
+    ("price range", {"min_price": 500, "max_price": 2000}),
+    ("bedrooms + bathrooms", {"min_bedrooms": 3, "min_bathrooms": 2}),
+    ("area range", {"min_area": 100, "max_area": 300}),
+    ("search", {"search": "apartamento caracas"}),
+    # Listing sorts (GET /api/properties/?sort=...)
+    ("sort price_asc", {"sort": "price_asc"}),
+    ("sort newest", {"sort": "newest"}),
+    ("sort largest", {"sort": "largest"}),
+    ("sort featured", {"sort": "featured"}),
+    ("property_type + sort price_desc", {"property_type": "Casa", "sort": "price_desc"}),
+]
+
+INDEX_PATTERNS = [
+    re.compile(r"USING (?:COVERING )?INDEX (\w+)"),      # SQLite
+    re.compile(r"Index (?:Only )?Scan(?: Backward)? using (\w+)"),  # PostgreSQL
+    re.compile(r"Bitmap Index Scan on (\w+)"),           # PostgreSQL
+    re.compile(r"SCAN (\w+) VIRTUAL TABLE"),             # SQLite FTS5
+]
+
+
+def staff_user(db: Session):
+    return db.query(models.User).filter(models.User.role == models.Role.staff).first()
+
+
+def explain(db: Session, label: str, filters: dict, current_user=None) -> None:
+    filters = dict(filters)
+    sort = filters.pop("sort", None)
+    query = crud_property.filtered_query(db, current_user=current_user, **filters)
+    query = crud_property._apply_sort(query, sort).limit(20)
+    dialect = db.get_bind().dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+    plan = [" | ".join(str(col) for col in row) for row in db.execute(text(prefix + sql))]
+
+    used = []
+    for line in plan:
+        for pattern in INDEX_PATTERNS:
+            used.extend(m for m in pattern.findall(line) if m)
+    print(f"== {label}")
+    print(f"   filters: {filters or '-'}")
+    print(f"   indexes: {', '.join(dict.fromkeys(used)) or 'none (full scan)'}")
+    for line in plan:
+        print(f"     {line}")
+    print()
+
+
+def main() -> None:
+    db: Session = SessionLocal()
+    try:
+        for label, filters in FILTER_SETS:
+            explain(db, label, filters)
+        staff = staff_user(db)
+        if staff:
+            explain(db, f"staff scope ({staff.username})", {}, current_user=staff)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
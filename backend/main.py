@@ -19,12 +19,41 @@ try:
 except ImportError as e:
     logger.error(f"Failed to import CORSMiddleware: {e}")
     raise
+try:
+    from core.compression import CompressionMiddleware
+    logger.info("Imported CompressionMiddleware from core.compression")
+except ImportError as e:
+    logger.error(f"Failed to import CompressionMiddleware: {e}")
+    raise
+try:
+    from core.serializers import ORJSONResponse
+    logger.info("Imported ORJSONResponse from core.serializers")
+except ImportError as e:
+    logger.error(f"Failed to import ORJSONResponse: {e}")
+    raise
 try:
     from core.config import settings  # settings needed early
     logger.info("Imported settings from core.config")
 except ImportError as e:
     logger.error(f"Failed to import settings from core.config: {e}")
     raise
+try:
+    from contextlib import asynccontextmanager
+    from core.click_ingest import click_ingestor
+    from core.database import SessionLocal
+    from crud import property as crud_property
+    from crud.property_clicks import record_clicks
+    from crud.click_rollups import run_click_rollups
+    from core.jobs import PeriodicJob
+    from core.trending import trending_scores
+    from crud.trending import load_trending_checkpoint, fold_new_clicks, save_trending_checkpoint
+    from crud.job_leases import acquire_lease, release_leases
+    import os
+    import socket
+    logger.info("Imported click_ingestor, SessionLocal, crud_property, record_clicks, run_click_rollups, PeriodicJob, trending, job leases")
+except ImportError as e:
+    logger.error(f"Failed to import click ingestion dependencies: {e}")
+    raise
 
 # Assuming routers are defined in the ./routers directory
 # from .routers import properties, users, settings, team, contact, uploads
@@ -34,11 +63,76 @@ except ImportError as e:
 # Uncomment the below line if using SQLAlchemy and Alembic migrations
 # models.Base.metadata.create_all(bind=engine)
 
+# Identifies this worker process in job_leases
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+def job_lease(name: str, interval_seconds: float):
+    """Lease check for a job that must run in one worker only; another worker takes over after three missed runs."""
+    def holds_lease() -> bool:
+        with SessionLocal() as db:
+            return acquire_lease(db, name, WORKER_ID, 3 * interval_seconds)
+    return holds_lease
+
+def flush_clicks(clicks: list) -> int:
+    with SessionLocal() as db:
+        return record_clicks(db, clicks)
+
+def rollup_clicks() -> int:
+    with SessionLocal() as db:
+        return run_click_rollups(db, settings.CLICK_ROLLUP_BATCH_SIZE)
+
+click_rollup_job = PeriodicJob(
+    "click_rollups", settings.CLICK_ROLLUP_INTERVAL_SECONDS, rollup_clicks,
+    lease=job_lease("click_rollups", settings.CLICK_ROLLUP_INTERVAL_SECONDS),
+)
+
+def refresh_trending() -> int:
+    with SessionLocal() as db:
+        if not trending_scores.loaded:
+            load_trending_checkpoint(db, trending_scores)
+        return fold_new_clicks(db, trending_scores, settings.CLICK_ROLLUP_BATCH_SIZE)
+
+def checkpoint_trending() -> int:
+    with SessionLocal() as db:
+        return save_trending_checkpoint(db, trending_scores)
+
+# The refresh only reads the click log into this worker's own scores, so every worker runs it;
+# the checkpoint writes shared rows, so one worker does
+trending_refresh_job = PeriodicJob("trending_refresh", settings.TRENDING_REFRESH_SECONDS, refresh_trending)
+trending_checkpoint_job = PeriodicJob(
+    "trending_checkpoint", settings.TRENDING_CHECKPOINT_SECONDS, checkpoint_trending,
+    lease=job_lease("trending_checkpoint", settings.TRENDING_CHECKPOINT_SECONDS),
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.CLICK_INGESTION_MODE == "buffered":
+        with SessionLocal() as db:
+            known_ids = crud_property.get_property_ids(db)
+        click_ingestor.start(flush_clicks, known_ids)
+    if settings.CLICK_ROLLUP_INTERVAL_SECONDS > 0:
+        click_rollup_job.start()
+    if settings.TRENDING_REFRESH_SECONDS > 0:
+        trending_refresh_job.start()
+        trending_checkpoint_job.start()
+    yield
+    click_rollup_job.stop()
+    trending_refresh_job.stop()
+    trending_checkpoint_job.stop()
+    if trending_scores.loaded:
+        trending_checkpoint_job.run_once()
+    with SessionLocal() as db:
+        release_leases(db, WORKER_ID)
+    # Write out clicks still in the queue before the worker exits
+    click_ingestor.stop()
+
 logger.info("Initializing FastAPI app...")
 app = FastAPI(
     title="Habitat API",
     description="API for the Habitat Real Estate Application",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 logger.info("FastAPI app initialized.")
 
@@ -58,9 +152,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],  # Let browser clients read pagination and caching headers
 )
 logger.info("CORS middleware added.")
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+    logger.info(f"Compression middleware added (minimum size {settings.COMPRESSION_MIN_SIZE} bytes).")
+
 @app.get("/")
 def read_root():
     logger.debug("Root endpoint / called")
@@ -75,7 +174,7 @@ async def health_check():
 # Include routers from the routers directory
 logger.info("Importing routers...")
 try:
-    from routers import properties, users, team, settings as settings_router, contact, uploads
+    from routers import properties, users, team, settings as settings_router, contact, uploads, metrics
     logger.info("Imported all routers")
 except ImportError as e:
     logger.error(f"Failed to import routers: {e}")
@@ -94,6 +193,8 @@ app.include_router(contact.router, prefix="/api/contact", tags=["contact"])
 logger.debug("Included contact router.")
 app.include_router(uploads.router, prefix="/api/uploads", tags=["uploads"])
 logger.debug("Included uploads router.")
+app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
+logger.debug("Included metrics router.")
 logger.info("All routers included.")
 
 # Add logic for serving static files if backend handles uploads directly
@@ -1,9 +1,11 @@
-from sqlalchemy import (Boolean, Column, Integer, String, Text, Float, DateTime, 
-                          ForeignKey, JSON, Enum)
+from sqlalchemy import (Boolean, Column, Integer, String, Text, Float, DateTime, Date, LargeBinary,
+                          ForeignKey, JSON, Enum, DDL, Index, UniqueConstraint, event)
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func
 import enum
 
+from utils.geo import point_geohash
+
 # Using declarative_base() from SQLAlchemy
 Base = declarative_base()
 
@@ -42,6 +44,18 @@ class User(Base):
 
 class Property(Base):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Composite indexes for the common get_properties filter combinations
+        Index("ix_properties_listing_type_property_type_price", "listing_type", "property_type", "price"),
+        Index("ix_properties_property_type_price", "property_type", "price"),
+        Index("ix_properties_bedrooms_bathrooms", "bedrooms", "bathrooms"),
+        Index("ix_properties_assigned_to_id_id", "assigned_to_id", "id"),
+        # (sort column, id) indexes serve both the range filters and the listing sorts
+        Index("ix_properties_price_id", "price", "id"),
+        Index("ix_properties_square_feet_id", "square_feet", "id"),
+        Index("ix_properties_created_at_id", "created_at", "id"),
+        Index("ix_properties_is_featured_id", "is_featured", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -57,7 +71,11 @@ class Property(Base):
     image_url = Column(String, nullable=True) 
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
+    # Derived from latitude/longitude on every flush; serves bbox/radius searches with a btree range scan
+    geohash = Column(String(12), nullable=True, index=True)
     is_featured = Column(Boolean, default=False)
+    # Maintained incrementally by crud.property_clicks so listings never count the click log
+    click_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -72,13 +90,52 @@ class Property(Base):
     created_by = relationship("User", foreign_keys=[created_by_user_id], back_populates="created_properties")
 
     images = relationship("PropertyImage", back_populates="property", cascade="all, delete-orphan")
-    clicks = relationship("PropertyClick", back_populates="property") # Relationship to PropertyClick
+    # Click history is paged via GET /api/properties/{id}/clicks/; never load it with the property.
+    # passive_deletes: delete_property removes the clicks with one DELETE instead of loading them.
+    clicks = relationship("PropertyClick", back_populates="property", lazy="noload", passive_deletes=True)
+
+# Full-text search over title, location and description.
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+# PostgreSQL: a generated, weighted tsvector column served by a GIN index.
+# Alembic revision c4e8f1a2b3d5 creates the same objects on existing databases.
+PROPERTY_FTS_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5("
+    "title, location, description, content='properties', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_ai AFTER INSERT ON properties BEGIN "
+    "INSERT INTO properties_fts(rowid, title, location, description) "
+    "VALUES (new.id, new.title, new.location, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_ad AFTER DELETE ON properties BEGIN "
+    "INSERT INTO properties_fts(properties_fts, rowid, title, location, description) "
+    "VALUES ('delete', old.id, old.title, old.location, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_au AFTER UPDATE OF title, location, description ON properties BEGIN "
+    "INSERT INTO properties_fts(properties_fts, rowid, title, location, description) "
+    "VALUES ('delete', old.id, old.title, old.location, old.description); "
+    "INSERT INTO properties_fts(rowid, title, location, description) "
+    "VALUES (new.id, new.title, new.location, new.description); END",
+]
+PROPERTY_FTS_POSTGRES_DDL = [
+    "ALTER TABLE properties ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_properties_search_vector ON properties USING GIN (search_vector)",
+]
+for _stmt in PROPERTY_FTS_SQLITE_DDL:
+    event.listen(Property.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+for _stmt in PROPERTY_FTS_POSTGRES_DDL:
+    event.listen(Property.__table__, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
+
+@event.listens_for(Property, "before_insert")
+@event.listens_for(Property, "before_update")
+def _sync_property_geohash(mapper, connection, target):
+    target.geohash = point_geohash(target.latitude, target.longitude)
 
 class PropertyImage(Base):
     __tablename__ = "property_images"
 
     id = Column(Integer, primary_key=True, index=True)
-    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False)
+    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False, index=True)
     image_url = Column(String, nullable=False)
     order = Column(Integer, default=0) # For ordering images in a gallery
 
@@ -105,7 +162,7 @@ class Contact(Base):
     property_id = Column(Integer, ForeignKey("properties.id"), nullable=True) # Link to specific property if applicable
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
     is_read = Column(Boolean, default=False)
-    assigned_to_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    assigned_to_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
 
     assigned_to = relationship("User", foreign_keys=[assigned_to_id], back_populates="assigned_contacts")
     # Add relationship back to property if needed
@@ -119,9 +176,13 @@ class Contact(Base):
 # New Model for Property Clicks
 class PropertyClick(Base):
     __tablename__ = "property_clicks"
+    __table_args__ = (
+        # Serves the click rollup job's per-property time-range aggregates
+        Index("ix_property_clicks_property_id_clicked_at", "property_id", "clicked_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False)
+    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False, index=True)
     clicked_at = Column(DateTime(timezone=True), server_default=func.now())
     ip_address = Column(String, nullable=True)
     user_agent = Column(String, nullable=True)
@@ -131,5 +192,92 @@ class PropertyClick(Base):
     property = relationship("Property", back_populates="clicks")
     # user = relationship("User") # If user_id is added
 
+class PropertyClickRollup(Base):
+    """Clicks per property per hour or day, maintained by crud.click_rollups from property_clicks."""
+    __tablename__ = "property_click_rollups"
+    __table_args__ = (
+        UniqueConstraint("property_id", "granularity", "bucket_start", name="uq_property_click_rollups_bucket"),
+        # Top-properties report: all properties' buckets in a time range
+        Index("ix_property_click_rollups_granularity_bucket_start", "granularity", "bucket_start"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False)
+    granularity = Column(String(8), nullable=False)  # 'hour' or 'day'
+    bucket_start = Column(DateTime, nullable=False)  # UTC, truncated to the granularity
+    count = Column(Integer, nullable=False, default=0)
+    unique_ips = Column(Integer, nullable=False, default=0)
+
+class PropertyVisitorSketch(Base):
+    """HyperLogLog sketch (utils.hyperloglog) of the distinct visitor IPs of a property on one UTC day."""
+    __tablename__ = "property_visitor_sketches"
+    __table_args__ = (
+        UniqueConstraint("property_id", "day", name="uq_property_visitor_sketches_day"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    property_id = Column(Integer, ForeignKey("properties.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    sketch = Column(LargeBinary, nullable=False)
+
+class PropertyTrendingScore(Base):
+    """Checkpoint of core.trending's decayed click score of a property, valid at scored_at (UTC)."""
+    __tablename__ = "property_trending_scores"
+
+    property_id = Column(Integer, primary_key=True)  # no FK: rows of deleted properties are skipped and pruned
+    score = Column(Float, nullable=False)
+    scored_at = Column(DateTime, nullable=False)
+
+class JobCheckpoint(Base):
+    """How far an incremental background job has got, e.g. the last property_clicks id it has processed."""
+    __tablename__ = "job_checkpoints"
+
+    name = Column(String, primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class JobLease(Base):
+    """Which worker runs a singleton background job; the holder renews it on every run, others take over once it expires."""
+    __tablename__ = "job_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+class RowCounter(Base):
+    """Row count of a table, kept exact by insert/delete triggers so totals need no COUNT(*) scan."""
+    __tablename__ = "row_counters"
+
+    table_name = Column(String, primary_key=True)
+    row_count = Column(Integer, nullable=False, default=0)
+
+# Triggers maintaining row_counters['properties'] on every insert and delete, whichever code path
+# or worker writes. Alembic revision e8b3f5a1c26d creates the same objects on existing databases.
+PROPERTY_ROW_COUNT_SQLITE_DDL = [
+    # count(*) in a scalar subquery: a bare aggregate would yield a row (and a duplicate key) even when NOT EXISTS is false
+    "INSERT INTO row_counters (table_name, row_count) SELECT 'properties', (SELECT count(*) FROM properties) "
+    "WHERE NOT EXISTS (SELECT 1 FROM row_counters WHERE table_name = 'properties')",
+    "CREATE TRIGGER IF NOT EXISTS properties_count_ai AFTER INSERT ON properties BEGIN "
+    "UPDATE row_counters SET row_count = row_count + 1 WHERE table_name = 'properties'; END",
+    "CREATE TRIGGER IF NOT EXISTS properties_count_ad AFTER DELETE ON properties BEGIN "
+    "UPDATE row_counters SET row_count = row_count - 1 WHERE table_name = 'properties'; END",
+]
+PROPERTY_ROW_COUNT_POSTGRES_DDL = [
+    # count(*) in a scalar subquery: a bare aggregate would yield a row (and a duplicate key) even when NOT EXISTS is false
+    "INSERT INTO row_counters (table_name, row_count) SELECT 'properties', (SELECT count(*) FROM properties) "
+    "WHERE NOT EXISTS (SELECT 1 FROM row_counters WHERE table_name = 'properties')",
+    "CREATE OR REPLACE FUNCTION properties_row_count() RETURNS trigger AS $$ BEGIN "
+    "UPDATE row_counters SET row_count = row_count + CASE WHEN TG_OP = 'INSERT' THEN 1 ELSE -1 END "
+    "WHERE table_name = 'properties'; RETURN NULL; END $$ LANGUAGE plpgsql",
+    "DO $$ BEGIN IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'properties_row_count') THEN "
+    "CREATE TRIGGER properties_row_count AFTER INSERT OR DELETE ON properties "
+    "FOR EACH ROW EXECUTE FUNCTION properties_row_count(); END IF; END $$",
+]
+# On the metadata, not the table: both tables must exist before the triggers are created
+for _stmt in PROPERTY_ROW_COUNT_SQLITE_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+for _stmt in PROPERTY_ROW_COUNT_POSTGRES_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
+
 # If you have a different base or metadata object, ensure this model uses it.
 # For example, if you are using Base = declarative_base() from a different file. 
\ No newline at end of file
@@ -0,0 +1,71 @@
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+logger.info("Loading metrics router...")
+
+try:
+    from fastapi import APIRouter, Depends
+    logger.info("Imported APIRouter, Depends from fastapi")
+except ImportError as e:
+    logger.error(f"Failed to import from fastapi: {e}")
+    raise
+try:
+    import models
+    logger.info("Imported models")
+except ImportError as e:
+    logger.error(f"Failed to import models: {e}")
+    raise
+try:
+    from core.cache import cache_stats
+    logger.info("Imported cache_stats from core.cache")
+except ImportError as e:
+    logger.error(f"Failed to import cache_stats: {e}")
+    raise
+try:
+    from core.click_ingest import click_ingestor
+    logger.info("Imported click_ingestor from core.click_ingest")
+except ImportError as e:
+    logger.error(f"Failed to import click_ingestor: {e}")
+    raise
+try:
+    from core.click_filter import click_filter
+    logger.info("Imported click_filter from core.click_filter")
+except ImportError as e:
+    logger.error(f"Failed to import click_filter: {e}")
+    raise
+try:
+    from core.jobs import jobs_stats
+    logger.info("Imported jobs_stats from core.jobs")
+except ImportError as e:
+    logger.error(f"Failed to import jobs_stats: {e}")
+    raise
+try:
+    from core.singleflight import singleflight_stats
+    logger.info("Imported singleflight_stats from core.singleflight")
+except ImportError as e:
+    logger.error(f"Failed to import singleflight_stats: {e}")
+    raise
+try:
+    from auth import utils as auth_utils
+    logger.info("Imported utils as auth_utils from auth")
+except ImportError as e:
+    logger.error(f"Failed to import auth_utils: {e}")
+    raise
+
+router = APIRouter()
+logger.info("Metrics router APIRouter initialized.")
+
+# Counters are per worker process; each request reports the worker that served it.
+@router.get("/")
+def read_metrics(current_admin: models.User = Depends(auth_utils.require_admin)):
+    logger.debug(f"GET /api/metrics/ called by admin {current_admin.username}")
+    return {
+        "caches": cache_stats(),
+        "singleflight": singleflight_stats(),
+        "clicks": click_ingestor.stats(),
+        "click_filter": click_filter.stats(),
+        "jobs": jobs_stats(),
+    }
+
+logger.info("Metrics router loaded successfully.")
@@ -5,7 +5,7 @@ logger.setLevel(logging.DEBUG)
 logger.info("Loading properties router...")
 
 try:
-    from fastapi import APIRouter, Depends, HTTPException, status, Request
+    from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query, Header
     logger.info("Imported from fastapi")
 except ImportError as e:
     logger.error(f"Failed to import from fastapi: {e}")
@@ -23,8 +23,8 @@ except ImportError as e:
     logger.error(f"Failed to import List, Optional from typing: {e}")
     raise
 try:
-    from core.database import get_db
-    logger.info("Imported get_db from core.database")
+    from core.database import get_db, SessionLocal
+    logger.info("Imported get_db, SessionLocal from core.database")
 except ImportError as e:
     logger.error(f"Failed to import get_db from core.database: {e}")
     raise
@@ -36,16 +36,27 @@ except ImportError as e:
     raise
 try:
     from crud import property as crud_property
-    logger.info("Imported property as crud_property from crud")
+    from crud.properties import InvalidCursorError, EXPORT_COLUMNS
+    logger.info("Imported property as crud_property, InvalidCursorError, EXPORT_COLUMNS from crud")
 except ImportError as e:
     logger.error(f"Failed to import crud_property: {e}")
     raise
 try:
-    from crud.property_clicks import create_property_click
-    logger.info("Imported create_property_click from crud.property_clicks")
+    from crud.property_clicks import create_property_click, get_property_clicks
+    from core.click_ingest import click_ingestor
+    from core.click_filter import click_filter
+    logger.info("Imported create_property_click, get_property_clicks from crud.property_clicks")
 except ImportError as e:
     logger.error(f"Failed to import create_property_click: {e}")
     raise
+try:
+    from datetime import datetime
+    from crud.click_rollups import get_property_rollups, get_top_properties, estimate_unique_visitors, stats_range, GRANULARITIES
+    from utils.hyperloglog import standard_error
+    logger.info("Imported datetime, click rollup helpers from crud.click_rollups, standard_error from utils.hyperloglog")
+except ImportError as e:
+    logger.error(f"Failed to import click rollup helpers: {e}")
+    raise
 try:
     from auth import utils as auth_utils
     logger.info("Imported utils as auth_utils from auth")
@@ -70,6 +81,38 @@ try:
 except ImportError as e:
     logger.error(f"Failed to import crud_user: {e}")
     raise
+try:
+    from core.cache import property_list_cache, property_count_cache, property_facets_cache, property_clusters_cache, property_featured_cache, property_trending_cache, make_etag, etag_matches
+    from core.trending import trending_scores
+    from core.compression import compress_cached
+    from core.singleflight import property_list_flight, property_featured_flight
+    logger.info("Imported property caches, make_etag, etag_matches from core.cache")
+except ImportError as e:
+    logger.error(f"Failed to import property_list_cache: {e}")
+    raise
+try:
+    from utils.geo import parse_bbox, parse_point, tiles_covering
+    logger.info("Imported parse_bbox, parse_point, tiles_covering from utils.geo")
+except ImportError as e:
+    logger.error(f"Failed to import utils.geo: {e}")
+    raise
+try:
+    from pydantic import ValidationError
+    from starlette.concurrency import run_in_threadpool
+    from utils.bulk_import import iter_json_array, iter_csv_dicts, MultipartFileReader
+    logger.info("Imported ValidationError, run_in_threadpool, bulk import parsers")
+except ImportError as e:
+    logger.error(f"Failed to import bulk import helpers: {e}")
+    raise
+try:
+    import csv
+    import io
+    from fastapi.responses import StreamingResponse
+    from core.serializers import dumps, serialize_many, json_response
+    logger.info("Imported csv, io, StreamingResponse, dumps, serialize_many, json_response")
+except ImportError as e:
+    logger.error(f"Failed to import export and serialization helpers: {e}")
+    raise
 
 # Import models, schemas, crud functions, and db session dependency
 # from .. import models, schemas, crud
@@ -104,49 +147,452 @@ def get_optional_current_user(db: Session = Depends(get_db), token: Optional[str
             return None
     return None
 
+def json_bytes_response(body: bytes, headers: Optional[dict] = None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def cached_json_response(body: bytes, headers: dict, variants: dict, accept_encoding: Optional[str]) -> Response:
+    """Send a cached JSON body, compressed once per encoding and kept in `variants` (part of the cache entry)."""
+    body, encoding = compress_cached(body, accept_encoding, variants)
+    headers = dict(headers, Vary="Accept-Encoding")
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return json_bytes_response(body, headers)
+
+def not_modified(headers: dict) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+# Named field sets accepted by `fields=`; "card" is what listing cards render
+PROPERTY_FIELD_SETS = {
+    "card": ("id", "title", "price", "location", "image_url", "bedrooms"),
+}
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple]:
+    """Validate a `fields=` value into a tuple of schemas.Property field names (in schema order), or None for all fields."""
+    if not fields:
+        return None
+    names = {"id"}
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name in PROPERTY_FIELD_SETS:
+            names.update(PROPERTY_FIELD_SETS[name])
+        elif name in schemas.Property.model_fields:
+            names.add(name)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field '{name}'. Use field names of the property schema or one of: {', '.join(PROPERTY_FIELD_SETS)}"
+            )
+    return tuple(name for name in schemas.Property.model_fields if name in names)
+
+def render_properties(properties: list, fields: Optional[tuple] = None) -> bytes:
+    """JSON bytes for properties as schemas.Property (or only `fields`), via the precompiled fast serializer."""
+    return dumps(serialize_many(schemas.Property, properties, fields))
+
+def listing_headers(
+    db: Session, headers: dict, params: dict, current_user: Optional[models.User], include_total: bool
+) -> dict:
+    """Response headers for a listing page, plus X-Total-Count when asked for."""
+    if not include_total:
+        return headers
+    filters = {name: value for name, value in params.items() if name not in ("skip", "limit", "cursor", "sort", "fields")}
+    # Cached per filter set, not per page, so every page of a listing shares one COUNT
+    key = (listing_cache_key(filters), user_scope(current_user))
+    total = property_count_cache.get(key)
+    if total is None:
+        total = crud_property.count_properties(db, current_user=current_user, **filters)
+        property_count_cache.set(key, total)
+    return {**headers, "X-Total-Count": str(total)}
+
+def user_scope(current_user: Optional[models.User]) -> Optional[tuple]:
+    """The part of the caller's identity that changes listing results (staff only see their assignments)."""
+    if current_user and current_user.role == models.Role.staff:
+        return ("staff", current_user.id)
+    return None
+
+def listing_cache_key(params: dict) -> tuple:
+    """Normalize listing query parameters so equivalent requests share a cache entry."""
+    normalized = []
+    for name, value in sorted(params.items()):
+        if isinstance(value, str):
+            # Search matching is case-insensitive; other filters compare exactly. "" means no filter.
+            value = (value.lower() if name == "search" else value) or None
+        if name == "skip" and params.get("cursor"):
+            value = 0 # skip is ignored in cursor mode
+        normalized.append((name, value))
+    return tuple(normalized)
+
+class PropertyFilters:
+    """Query parameters shared by every endpoint that filters properties like GET /api/properties/."""
+    def __init__(
+        self,
+        search: Optional[str] = None,
+        property_type: Optional[str] = None,
+        listing_type: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_bedrooms: Optional[int] = None,
+        max_bedrooms: Optional[int] = None,
+        min_bathrooms: Optional[int] = None,
+        max_bathrooms: Optional[int] = None,
+        min_area: Optional[float] = None,
+        max_area: Optional[float] = None,
+        bbox: Optional[str] = Query(None, description="Map viewport as 'min_lng,min_lat,max_lng,max_lat'"),
+        near: Optional[str] = Query(None, description="'lat,lng'; results are ordered by distance"),
+        radius_km: Optional[float] = Query(None, gt=0, le=500),
+    ):
+        try:
+            self.bbox = parse_bbox(bbox) if bbox else None
+            self.near = parse_point(near) if near else None
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        self.radius_km = radius_km if near else None
+        self.search = " ".join(search.split()) or None if search else None
+        self.property_type = property_type
+        self.listing_type = listing_type
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_bedrooms = min_bedrooms
+        self.max_bedrooms = max_bedrooms
+        self.min_bathrooms = min_bathrooms
+        self.max_bathrooms = max_bathrooms
+        self.min_area = min_area
+        self.max_area = max_area
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+def build_listing_page(db: Session, params: dict, current_user: Optional[models.User]) -> tuple:
+    """Load and render one listing page as (etag, body, headers).
+
+    The ETag is a hash of the rendered body, so revalidation costs the same
+    keyset page query as a full response and needs no aggregate over the
+    filtered set. X-Next-Cursor is added to the headers when there is a next page.
+    """
+    properties = crud_property.get_properties(db, current_user=current_user, **params)
+    logger.debug(f"Retrieved {len(properties)} properties.")
+    headers = {"Cache-Control": "public, no-cache" if current_user is None else "private, no-cache"}
+    next_cursor = crud_property.next_cursor(
+        properties, params["limit"], **{name: value for name, value in params.items() if name != "limit"}
+    )
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    body = render_properties(properties, params["fields"])
+    etag = make_etag(body)
+    headers["ETag"] = etag
+    return etag, body, headers
+
+def build_cached_listing(db: Session, params: dict, cache_key: tuple) -> tuple:
+    """Build and cache an anonymous listing page as (etag, body, headers, compressed variants)."""
+    etag, body, headers = build_listing_page(db, params, None)
+    entry = (etag, body, headers, {})
+    property_list_cache.set(cache_key, entry)
+    return entry
+
 @router.get("/", response_model=List[schemas.Property]) # Replace PropertySchema with actual schemas.Property
 def read_properties(
     skip: int = 0,
     limit: int = 20,
-    search: Optional[str] = None,
-    property_type: Optional[str] = None,
-    listing_type: Optional[str] = None,
-    min_price: Optional[float] = None,
-    max_price: Optional[float] = None,
-    min_bedrooms: Optional[int] = None,
-    max_bedrooms: Optional[int] = None,
-    min_bathrooms: Optional[int] = None,
-    max_bathrooms: Optional[int] = None,
-    min_area: Optional[float] = None,
-    max_area: Optional[float] = None,
+    cursor: Optional[str] = None, # Opaque keyset cursor from a previous X-Next-Cursor header; overrides skip
+    sort: Optional[schemas.PropertySort] = None, # Defaults to id order, or to relevance/distance with search/near
+    include_total: bool = False, # Adds an X-Total-Count header with the number of matching properties
+    fields: Optional[str] = None, # Comma-separated field names and/or "card"; all fields when omitted
+    filters: PropertyFilters = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_optional_current_user) # Use optional user
 ):
-    logger.debug(f"GET /api/properties/ called with params: skip={skip}, limit={limit}, search='{search}', ...")
+    logger.debug(f"GET /api/properties/ called with params: skip={skip}, limit={limit}, cursor={cursor!r}, sort={sort}, include_total={include_total}, fields={fields}, filters={filters.as_dict()}")
+    params = dict(
+        skip=skip, limit=limit, cursor=cursor, sort=sort.value if sort else None,
+        fields=parse_fields(fields), **filters.as_dict()
+    )
+    # Only anonymous traffic is cached: authenticated results depend on the user's role.
+    # Oversized pages are not: 256 full-catalog bodies per worker would be pinned otherwise.
+    cacheable = current_user is None and limit <= settings.PROPERTY_CACHE_MAX_LIMIT
+    cache_key = listing_cache_key(params) if cacheable else None
     try:
-        properties = crud_property.get_properties(
-            db, skip=skip, limit=limit, search=search, property_type=property_type,
-            listing_type=listing_type, min_price=min_price, max_price=max_price,
-            min_bedrooms=min_bedrooms, max_bedrooms=max_bedrooms,
-            min_bathrooms=min_bathrooms, max_bathrooms=max_bathrooms,
-            min_area=min_area, max_area=max_area, current_user=current_user # Pass current_user
-        )
-        logger.debug(f"Retrieved {len(properties)} properties.")
-        return properties
+        if cache_key is not None:
+            entry = property_list_cache.get(cache_key)
+            if entry is not None:
+                logger.debug("Serving properties page from cache.")
+            else:
+                # Concurrent misses for the same page share one build (queries and rendering)
+                entry = property_list_flight.do(cache_key, lambda: build_cached_listing(db, params, cache_key))
+            etag, body, headers, variants = entry
+            headers = listing_headers(db, headers, params, None, include_total)
+            if etag_matches(if_none_match, etag):
+                return not_modified(headers)
+            return cached_json_response(body, headers, variants, accept_encoding)
+
+        etag, body, headers = build_listing_page(db, params, current_user)
+        headers = listing_headers(db, headers, params, current_user, include_total)
+        if etag_matches(if_none_match, etag):
+            logger.debug("Properties page not modified.")
+            return not_modified(headers)
+        return json_bytes_response(body, headers)
+    except InvalidCursorError as e:
+        logger.warn(f"Bad request in read_properties: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error in read_properties: {e}", exc_info=True)
         raise
 
+@router.get("/facets/", response_model=schemas.PropertyFacets)
+def read_property_facets(
+    filters: PropertyFilters = Depends(),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(get_optional_current_user)
+):
+    logger.debug(f"GET /api/properties/facets called with filters={filters.as_dict()}")
+    cache_key = (listing_cache_key(filters.as_dict()), user_scope(current_user))
+    try:
+        facets = property_facets_cache.get(cache_key)
+        if facets is None:
+            facets = crud_property.get_facets(db, current_user=current_user, **filters.as_dict())
+            property_facets_cache.set(cache_key, facets)
+        logger.debug(f"Facets computed over {facets['total']} properties.")
+        return facets
+    except Exception as e:
+        logger.error(f"Error in read_property_facets: {e}", exc_info=True)
+        raise
+
+EXPORT_CHUNK_BYTES = 64 * 1024 # rows are sent in chunks of about this size
+EXPORT_MEDIA_TYPES = {
+    schemas.ExportFormat.ndjson: "application/x-ndjson",
+    schemas.ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+def export_chunks(export_format: schemas.ExportFormat, current_user: Optional[models.User], sort: Optional[str], filters: dict):
+    """Render the export as a stream of byte chunks.
+
+    The generator runs while the response is being sent, after the request's
+    get_db session has been closed, so it reads through its own session.
+    """
+    db = SessionLocal()
+    try:
+        rows = crud_property.iter_export_rows(db, current_user=current_user, sort=sort, **filters)
+        buffer = io.StringIO()
+        if export_format == schemas.ExportFormat.csv:
+            writer = csv.DictWriter(buffer, fieldnames=[col.key for col in EXPORT_COLUMNS])
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda row: buffer.write(dumps(row).decode("utf-8") + "\n")
+        for row in rows:
+            write(row)
+            if buffer.tell() >= EXPORT_CHUNK_BYTES:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+    except Exception as e:
+        logger.error(f"Error while streaming property export: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+@router.get("/export/")
+def export_properties(
+    format: schemas.ExportFormat = schemas.ExportFormat.ndjson,
+    sort: Optional[schemas.PropertySort] = None,
+    filters: PropertyFilters = Depends(),
+    current_user: Optional[models.User] = Depends(get_optional_current_user)
+):
+    logger.debug(f"GET /api/properties/export called with format={format.value}, sort={sort}, filters={filters.as_dict()}")
+    filename = f"properties.{format.value}"
+    return StreamingResponse(
+        export_chunks(format, current_user, sort.value if sort else None, filters.as_dict()),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+MAX_BATCH_IDS = 100
+
+@router.get("/batch/", response_model=List[schemas.Property])
+def read_properties_batch(
+    ids: str = Query(..., description="Comma-separated property ids, e.g. '12,7,31'"),
+    db: Session = Depends(get_db)
+):
+    logger.debug(f"GET /api/properties/batch called with ids={ids}")
+    try:
+        property_ids = list(dict.fromkeys(int(part) for part in ids.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be a comma-separated list of integers")
+    if not property_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must not be empty")
+    if len(property_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids per request, got {len(property_ids)}"
+        )
+    try:
+        properties = crud_property.get_properties_by_ids(db, property_ids)
+        logger.debug(f"Found {len(properties)} of {len(property_ids)} requested properties.")
+        return json_bytes_response(render_properties(properties))
+    except Exception as e:
+        logger.error(f"Error in read_properties_batch: {e}", exc_info=True)
+        raise
+
+MAX_CLUSTER_ZOOM = 20
+MAX_CLUSTER_TILES = 64 # zoom in, or shrink the bbox, beyond this
+
+@router.get("/clusters/", response_model=schemas.PropertyClusters)
+def read_property_clusters(
+    bbox: str = Query(..., description="Map viewport as 'min_lng,min_lat,max_lng,max_lat'"),
+    zoom: int = Query(..., ge=0, le=MAX_CLUSTER_ZOOM),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(get_optional_current_user)
+):
+    logger.debug(f"GET /api/properties/clusters called with bbox={bbox}, zoom={zoom}")
+    try:
+        min_lat, min_lng, max_lat, max_lng = parse_bbox(bbox)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    tiles = tiles_covering(min_lat, min_lng, max_lat, max_lng, zoom)
+    if len(tiles) > MAX_CLUSTER_TILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"bbox spans {len(tiles)} tiles at zoom {zoom}; the maximum is {MAX_CLUSTER_TILES}"
+        )
+    try:
+        clusters = []
+        for x, y in tiles:
+            # Tiles are cached independently so panning only computes the newly visible ones
+            cache_key = (zoom, x, y, user_scope(current_user))
+            tile_clusters = property_clusters_cache.get(cache_key)
+            if tile_clusters is None:
+                tile_clusters = crud_property.get_tile_clusters(db, zoom, x, y, current_user=current_user)
+                property_clusters_cache.set(cache_key, tile_clusters)
+            clusters.extend(
+                cluster for cluster in tile_clusters
+                if min_lat <= cluster["latitude"] <= max_lat and min_lng <= cluster["longitude"] <= max_lng
+            )
+        logger.debug(f"Returning {len(clusters)} clusters from {len(tiles)} tiles.")
+        return {"zoom": zoom, "total": sum(cluster["count"] for cluster in clusters), "clusters": clusters}
+    except Exception as e:
+        logger.error(f"Error in read_property_clusters: {e}", exc_info=True)
+        raise
+
+# The card fields plus what the home page PropertySlider shows (frontend/components/PropertySlider.js)
+FEATURED_FIELDS = PROPERTY_FIELD_SETS["card"] + ("square_feet",)
+
+def build_featured_snapshot(db: Session) -> tuple:
+    """Render and cache the featured cards as (etag, body, headers, compressed variants)."""
+    properties = crud_property.get_featured_properties(db, settings.PROPERTY_FEATURED_LIMIT, fields=FEATURED_FIELDS)
+    body = render_properties(properties, FEATURED_FIELDS)
+    etag = make_etag("featured", body)
+    entry = (etag, body, {"ETag": etag, "Cache-Control": "public, no-cache"}, {})
+    property_featured_cache.set("featured", entry)
+    logger.info(f"Rebuilt featured properties snapshot ({len(properties)} properties, {len(body)} bytes).")
+    return entry
+
+@router.get("/featured/", response_model=List[schemas.Property])
+def read_featured_properties(
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    # Served from the in-memory snapshot; the DB is only read to rebuild it after a property write or TTL expiry.
+    # The session from get_db does not open a connection until it is used.
+    entry = property_featured_cache.get("featured")
+    if entry is None:
+        entry = property_featured_flight.do("featured", lambda: build_featured_snapshot(db))
+    etag, body, headers, variants = entry
+    if etag_matches(if_none_match, etag):
+        return not_modified(headers)
+    return cached_json_response(body, headers, variants, accept_encoding)
+
+MAX_TRENDING = 50
+
+@router.get("/trending/", response_model=List[schemas.TrendingProperty])
+def read_trending_properties(
+    limit: int = Query(10, ge=1, le=MAX_TRENDING),
+    accept_encoding: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    logger.debug(f"GET /api/properties/trending called with limit={limit}")
+    entry = property_trending_cache.get(limit)
+    if entry is None:
+        try:
+            # Ranking comes from the in-memory scores (heap top-K); only the cards are read from the DB
+            top = trending_scores.top(limit + 10) # a little spare for properties deleted since they were clicked
+            properties = crud_property.get_properties_by_ids(db, [property_id for property_id, _score in top])
+            found = {prop.id for prop in properties}
+            for property_id, _score in top:
+                if property_id not in found:
+                    trending_scores.discard(property_id)
+            scores = dict(top)
+            cards = serialize_many(schemas.Property, properties[:limit], PROPERTY_FIELD_SETS["card"])
+            for card in cards:
+                card["trending_score"] = round(scores[card["id"]], 3)
+            entry = (dumps(cards), {"Cache-Control": f"public, max-age={int(settings.TRENDING_REFRESH_SECONDS)}"}, {})
+            property_trending_cache.set(limit, entry)
+        except Exception as e:
+            logger.error(f"Error in read_trending_properties: {e}", exc_info=True)
+            raise
+    body, headers, variants = entry
+    return cached_json_response(body, headers, variants, accept_encoding)
+
+MAX_STATS_BUCKETS = 2400 # 100 days of hourly buckets, about 6.5 years of daily ones
+
+def parse_stats_range(start: Optional[datetime], end: Optional[datetime], granularity: schemas.StatsGranularity) -> tuple:
+    start, end = stats_range(start, end, granularity.value)
+    if start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must be before 'to'")
+    buckets = (end - start) / GRANULARITIES[granularity.value]
+    if buckets > MAX_STATS_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range spans {int(buckets)} {granularity.value} buckets; the maximum is {MAX_STATS_BUCKETS}"
+        )
+    return start, end
+
+@router.get("/stats/top/", response_model=schemas.TopPropertiesReport)
+def read_top_properties(
+    start: Optional[datetime] = Query(None, alias="from", description="Defaults to 30 days before 'to'"),
+    end: Optional[datetime] = Query(None, alias="to", description="Exclusive; defaults to now"),
+    granularity: schemas.StatsGranularity = schemas.StatsGranularity.day,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(auth_utils.require_admin)
+):
+    logger.debug(f"GET /api/properties/stats/top called by admin {current_admin.username}. from={start}, to={end}, granularity={granularity.value}")
+    start, end = parse_stats_range(start, end, granularity)
+    try:
+        properties = get_top_properties(db, granularity.value, start, end, limit)
+        return {"granularity": granularity, "start": start, "end": end, "properties": properties}
+    except Exception as e:
+        logger.error(f"Error in read_top_properties: {e}", exc_info=True)
+        raise
+
 @router.get("/{property_id}/", response_model=schemas.Property) # Replace PropertySchema
-def read_property(property_id: int, db: Session = Depends(get_db)):
-    logger.debug(f"GET /api/properties/{property_id} called.")
+def read_property(
+    property_id: int,
+    fields: Optional[str] = None, # Comma-separated field names and/or "card"; all fields when omitted
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    logger.debug(f"GET /api/properties/{property_id} called with fields={fields}.")
+    field_names = parse_fields(fields)
     try:
-        db_property = crud_property.get_property(db, property_id=property_id)
+        version = crud_property.get_property_version(db, property_id=property_id)
+        if version is None:
+            logger.warn(f"Property with id {property_id} not found.")
+            raise HTTPException(status_code=404, detail="Property not found")
+        headers = {"ETag": make_etag(*version, field_names), "Cache-Control": "public, no-cache"}
+        if etag_matches(if_none_match, headers["ETag"]):
+            logger.debug(f"Property {property_id} not modified.")
+            return not_modified(headers)
+
+        db_property = crud_property.get_property(db, property_id=property_id, fields=field_names)
         if db_property is None:
             logger.warn(f"Property with id {property_id} not found.")
             raise HTTPException(status_code=404, detail="Property not found")
-        logger.debug(f"Retrieved property: {db_property.title}")
-        return db_property
+        logger.debug(f"Retrieved property {db_property.id}.")
+        return json_bytes_response(dumps(serialize_many(schemas.Property, [db_property], field_names)[0]), headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -168,6 +614,80 @@ def create_property(
         logger.error(f"Error in create_property: {e}", exc_info=True)
         raise
 
+CSV_CONTENT_TYPES = ("text/csv", "application/csv", "application/vnd.ms-excel")
+
+@router.post("/bulk/", response_model=schemas.BulkImportResult)
+async def bulk_create_properties(
+    request: Request,
+    batch_size: Optional[int] = Query(None, ge=1, le=5000), # Defaults to settings.PROPERTY_BULK_BATCH_SIZE
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(auth_utils.require_manager)
+):
+    """Create many properties from a JSON array body, a text/csv body, or a multipart `file` upload.
+
+    The body is parsed as it streams in; valid rows are inserted in batches and
+    committed together at the end, invalid rows are skipped and reported.
+    """
+    batch_size = batch_size or settings.PROPERTY_BULK_BATCH_SIZE
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    logger.debug(f"POST /api/properties/bulk called by user {current_user.username} with content type '{content_type}', batch_size={batch_size}")
+
+    if content_type == "multipart/form-data":
+        # Parsed straight off the request stream; request.form() would spool the whole upload first
+        try:
+            upload = await MultipartFileReader(request.stream(), request.headers["content-type"]).open()
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        is_csv = (upload.filename or "").lower().endswith(".csv") or (upload.content_type or "") in CSV_CONTENT_TYPES
+        chunks = upload.chunks()
+    else:
+        is_csv = content_type in CSV_CONTENT_TYPES
+        chunks = request.stream()
+    records = iter_csv_dicts(chunks) if is_csv else iter_json_array(chunks)
+
+    created_ids, errors, batch = [], [], []
+    row_number = 0
+
+    async def flush_batch():
+        ids, batch_errors = await run_in_threadpool(crud_property.bulk_insert_properties, db, batch, current_user)
+        created_ids.extend(ids)
+        errors.extend(batch_errors)
+        batch.clear()
+
+    try:
+        async for record in records:
+            row_number += 1
+            try:
+                if not isinstance(record, dict):
+                    raise TypeError(f"expected an object, got {type(record).__name__}")
+                batch.append((row_number, schemas.PropertyCreate(**record)))
+            except ValidationError as e:
+                errors.append({
+                    "row": row_number,
+                    "errors": [f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()],
+                })
+                continue
+            except TypeError as e:
+                errors.append({"row": row_number, "errors": [str(e)]})
+                continue
+            if len(batch) >= batch_size:
+                await flush_batch()
+        if batch:
+            await flush_batch()
+        await run_in_threadpool(crud_property.finish_bulk_import, db)
+    except ValueError as e:
+        await run_in_threadpool(db.rollback)
+        logger.warn(f"Malformed bulk import body at row {row_number + 1}: {e}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Row {row_number + 1}: {e}")
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        logger.error(f"Error in bulk_create_properties: {e}", exc_info=True)
+        raise
+
+    errors.sort(key=lambda error: error["row"])
+    logger.info(f"Bulk import by {current_user.username}: {len(created_ids)} created, {len(errors)} rows rejected.")
+    return {"created": len(created_ids), "ids": created_ids, "errors": errors}
+
 @router.put("/{property_id}/", response_model=schemas.Property)
 def update_property(
     property_id: int,
@@ -211,6 +731,36 @@ def delete_property(
         logger.error(f"Error in delete_property for id {property_id}: {e}", exc_info=True)
         raise
 
+def is_prefetch(request: Request) -> bool:
+    """Speculative browser loads announce themselves with Sec-Purpose / Purpose: prefetch."""
+    purpose = request.headers.get("sec-purpose") or request.headers.get("purpose") or request.headers.get("x-moz") or ""
+    return "prefetch" in purpose.lower()
+
+def click_target_exists(property_id: int, db: Session) -> bool:
+    """In buffered mode the known-id set answers without a query; other ids are looked up once and remembered."""
+    if click_ingestor.running and click_ingestor.is_known(property_id):
+        return True
+    if not crud_property.property_exists(db, property_id):
+        return False
+    if click_ingestor.running:
+        # Created through another worker since startup
+        click_ingestor.remember(property_id)
+    return True
+
+def enqueue_property_click(property_id: int, request: Request) -> Response:
+    """Buffered mode: queue the click for the background flusher."""
+    client_host = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+    if not click_ingestor.offer(property_id, client_host, user_agent):
+        logger.warn(f"Click queue full, rejecting click for property {property_id}.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Click queue is full, retry later",
+            headers={"Retry-After": "1"}
+        )
+    click_filter.remember(property_id, client_host, user_agent)
+    return json_response({"property_id": property_id, "status": "accepted"}, status_code=status.HTTP_202_ACCEPTED)
+
 @router.post("/{property_id}/track-click/", response_model=schemas.PropertyClick, status_code=status.HTTP_201_CREATED)
 def track_property_click(
     property_id: int,
@@ -218,13 +768,21 @@ def track_property_click(
     db: Session = Depends(get_db)
 ):
     logger.debug(f"POST /api/properties/{property_id}/track-click called.")
+    # Unknown ids get 404 whatever the filter would say, and never count as suppressed
+    if not click_target_exists(property_id, db):
+        logger.warn(f"Property with id {property_id} not found for click tracking.")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
+    client_host = request.client.host if request.client else None
+    reason = click_filter.check(property_id, client_host, request.headers.get("user-agent"), prefetch=is_prefetch(request))
+    if reason:
+        logger.debug(f"Suppressed {reason} click for property {property_id}. IP: {client_host}")
+        return json_response(
+            {"property_id": property_id, "status": "suppressed", "reason": reason},
+            status_code=status.HTTP_202_ACCEPTED
+        )
+    if click_ingestor.running:
+        return enqueue_property_click(property_id, request)
     try:
-        db_property = crud_property.get_property(db, property_id=property_id)
-        if not db_property:
-            logger.warn(f"Property with id {property_id} not found for click tracking.")
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
-        
-        client_host = request.client.host if request.client else None
         user_agent = request.headers.get("user-agent")
         logger.debug(f"Tracking click for property {property_id}. IP: {client_host}, UA: {user_agent}")
 
@@ -234,14 +792,71 @@ def track_property_click(
             ip_address=client_host,
             user_agent=user_agent
         )
+        click_filter.remember(property_id, client_host, user_agent)
         logger.info(f"Click tracked for property {property_id}, click ID: {click.id}")
         return click
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Error in track_property_click for property id {property_id}: {e}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not record property click")
 
+@router.get("/{property_id}/stats/", response_model=schemas.PropertyClickStats)
+def read_property_stats(
+    property_id: int,
+    start: Optional[datetime] = Query(None, alias="from", description="Defaults to 30 days before 'to'"),
+    end: Optional[datetime] = Query(None, alias="to", description="Exclusive; defaults to now"),
+    granularity: schemas.StatsGranularity = schemas.StatsGranularity.day,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_utils.require_manager)
+):
+    logger.debug(f"GET /api/properties/{property_id}/stats called by user {current_user.username}. from={start}, to={end}, granularity={granularity.value}")
+    start, end = parse_stats_range(start, end, granularity)
+    try:
+        if not crud_property.property_exists(db, property_id):
+            logger.warn(f"Property with id {property_id} not found for click stats.")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
+        # Rollups only: the cost depends on the number of buckets, not on the size of the click log
+        rollups = get_property_rollups(db, property_id, granularity.value, start, end)
+        return {
+            "property_id": property_id,
+            "granularity": granularity,
+            "start": start,
+            "end": end,
+            "total_clicks": sum(rollup.count for rollup in rollups),
+            "unique_visitors": estimate_unique_visitors(db, property_id, start, end),
+            "unique_visitors_error": round(standard_error(), 4),
+            "buckets": [
+                {"bucket_start": rollup.bucket_start, "count": rollup.count, "unique_ips": rollup.unique_ips}
+                for rollup in rollups
+            ],
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in read_property_stats for property id {property_id}: {e}", exc_info=True)
+        raise
+
+@router.get("/{property_id}/clicks/", response_model=List[schemas.PropertyClick])
+def read_property_clicks(
+    property_id: int,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_utils.require_manager)
+):
+    logger.debug(f"GET /api/properties/{property_id}/clicks called by user {current_user.username}. Skip: {skip}, Limit: {limit}")
+    try:
+        if not crud_property.property_exists(db, property_id):
+            logger.warn(f"Property with id {property_id} not found for click history.")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found")
+        clicks = get_property_clicks(db, property_id=property_id, skip=skip, limit=limit)
+        logger.debug(f"Retrieved {len(clicks)} clicks for property {property_id}.")
+        return clicks
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in read_property_clicks for property id {property_id}: {e}", exc_info=True)
+        raise
+
 
 # Note: Ensure existing endpoints like create_property and update_property are correctly using
 # current_user for created_by_user_id and assigned_to_id logic as per previous phases.
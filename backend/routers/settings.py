@@ -41,6 +41,12 @@ try:
 except ImportError as e:
     logger.error(f"Failed to import crud_settings: {e}")
     raise
+try:
+    from core.serializers import json_response, compile_serializer
+    logger.info("Imported json_response, compile_serializer from core.serializers")
+except ImportError as e:
+    logger.error(f"Failed to import core.serializers: {e}")
+    raise
 try:
     from auth import utils as auth_utils
     logger.info("Imported utils as auth_utils from auth")
@@ -57,7 +63,8 @@ def get_all_settings(db: Session = Depends(get_db)):
     try:
         settings_data = crud_settings.get_settings(db)
         logger.debug(f"Retrieved settings data: {settings_data}")
-        return settings_data
+        serialize = compile_serializer(schemas.SiteSetting)
+        return json_response({key: serialize(row) for key, row in settings_data.items()})
     except Exception as e:
         logger.error(f"Error in get_all_settings: {e}", exc_info=True)
         raise
@@ -41,6 +41,12 @@ try:
 except ImportError as e:
     logger.error(f"Failed to import crud_team: {e}")
     raise
+try:
+    from core.serializers import json_response, serialize_many, compile_serializer
+    logger.info("Imported json_response, serialize_many, compile_serializer from core.serializers")
+except ImportError as e:
+    logger.error(f"Failed to import core.serializers: {e}")
+    raise
 try:
     from auth import utils as auth_utils
     logger.info("Imported utils as auth_utils from auth")
@@ -57,7 +63,7 @@ def read_team(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     try:
         members = crud_team.get_team_members(db, skip, limit)
         logger.debug(f"Retrieved {len(members)} team members.")
-        return members
+        return json_response(serialize_many(schemas.TeamMember, members))
     except Exception as e:
         logger.error(f"Error in read_team: {e}", exc_info=True)
         raise
@@ -71,7 +77,7 @@ def read_member(member_id: int, db: Session = Depends(get_db)):
             logger.warn(f"Team member with id {member_id} not found.")
             raise HTTPException(status_code=404, detail="Team member not found")
         logger.debug(f"Retrieved team member: {member.name}")
-        return member
+        return json_response(compile_serializer(schemas.TeamMember)(member))
     except HTTPException:
         raise
     except Exception as e:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, HttpUrl
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 from enum import Enum
 
@@ -43,6 +43,15 @@ class PropertyCreate(PropertyBase):
     # Field for new additional images, URLs will be provided after upload
     additional_image_urls: Optional[List[HttpUrl]] = None 
 
+class BulkImportRowError(BaseModel):
+    row: int # 1-based position in the JSON array, or data row number in the CSV
+    errors: List[str]
+
+class BulkImportResult(BaseModel):
+    created: int
+    ids: List[int] = [] # Ids of the created properties, in input order
+    errors: List[BulkImportRowError] = [] # Rows that were skipped
+
 class PropertyUpdate(PropertyBase):
     title: Optional[str] = None 
     # All fields from PropertyBase are implicitly optional because it's for updates (PATCH-like)
@@ -58,7 +67,7 @@ class Property(PropertyBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     images: List[PropertyImage] = [] # Include related images (PropertyImage schema)
-    clicks: List['PropertyClick'] = [] # Include click records to show click count
+    click_count: int = 0 # Click history is served separately by GET /{id}/clicks/
 
     # For returning assigned user details in responses
     assigned_to: Optional['User'] = None # Forward reference
@@ -67,6 +76,45 @@ class Property(PropertyBase):
     class Config:
         orm_mode = True
 
+class FacetBucket(BaseModel):
+    min: Optional[float] = None # Inclusive lower bound; None for the open-ended first bucket
+    max: Optional[float] = None # Exclusive upper bound; None for the open-ended last bucket
+    count: int
+
+class PropertyFacets(BaseModel):
+    total: int
+    # Category counts; properties with no value for a field are left out of that field's counts
+    property_type: Dict[str, int] = {}
+    listing_type: Dict[str, int] = {}
+    status: Dict[str, int] = {}
+    bedrooms: Dict[str, int] = {} # "0".."4", "5+"
+    bathrooms: Dict[str, int] = {} # "0".."3", "4+"
+    price: List[FacetBucket] = []
+    area: List[FacetBucket] = []
+
+class PropertySort(str, Enum):
+    price_asc = "price_asc"
+    price_desc = "price_desc"
+    newest = "newest"
+    largest = "largest"
+    featured = "featured"
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+class PropertyCluster(BaseModel):
+    latitude: float # Centroid of the properties in the grid cell
+    longitude: float
+    count: int
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+class PropertyClusters(BaseModel):
+    zoom: int
+    total: int
+    clusters: List[PropertyCluster] = []
+
 # ------------- Role Enum -------------
 
 class Role(str, Enum):
@@ -181,6 +229,46 @@ class UploadResponse(BaseModel):
     url: str  # Accept relative paths, not only absolute URLs
 
 # Schemas for Property Click Tracking
+class TrendingProperty(BaseModel):
+    id: int
+    title: str
+    price: Optional[float] = None
+    location: Optional[str] = None
+    image_url: Optional[HttpUrl] = None
+    bedrooms: Optional[int] = None
+    trending_score: float # Clicks, each weighted by 2^(-age / TRENDING_HALF_LIFE_HOURS)
+
+class StatsGranularity(str, Enum):
+    hour = "hour"
+    day = "day"
+
+class ClickStatsBucket(BaseModel):
+    bucket_start: datetime # UTC
+    count: int
+    unique_ips: int # Distinct IPs within this bucket
+
+class PropertyClickStats(BaseModel):
+    property_id: int
+    granularity: StatsGranularity
+    start: datetime
+    end: datetime # Exclusive
+    total_clicks: int
+    # HyperLogLog estimate of distinct visitor IPs over the whole UTC days the range touches
+    unique_visitors: int
+    unique_visitors_error: float # Relative standard error of unique_visitors (0.0325 = 3.25%)
+    buckets: List[ClickStatsBucket] = [] # Only buckets with clicks, oldest first
+
+class TopProperty(BaseModel):
+    property_id: int
+    title: Optional[str] = None
+    clicks: int
+
+class TopPropertiesReport(BaseModel):
+    granularity: StatsGranularity
+    start: datetime
+    end: datetime # Exclusive
+    properties: List[TopProperty] = []
+
 class PropertyClickBase(BaseModel):
     property_id: int
     ip_address: Optional[str] = None
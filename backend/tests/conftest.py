@@ -0,0 +1,20 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Point the app at a throwaway SQLite database before core.config is imported
+_db_dir = tempfile.mkdtemp(prefix="habitat-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    import main
+
+    # No context manager: the lifespan (click flusher, rollup and trending jobs) is not started
+    return TestClient(main.app)
@@ -0,0 +1,48 @@
+import pytest
+
+import models
+from core.click_filter import ClickFilter, click_filter
+from core.database import SessionLocal
+from routers import properties as properties_router
+
+BROWSER = "Mozilla/5.0 (X11; Linux x86_64) Firefox/130.0"
+
+
+@pytest.fixture
+def property_id():
+    with SessionLocal() as db:
+        prop = models.Property(title="Click target", price=1)
+        db.add(prop)
+        db.commit()
+        return prop.id
+
+
+def test_check_does_not_record_the_click():
+    clicks = ClickFilter(window_seconds=30, maxsize=100)
+    assert clicks.check(1, "10.0.0.1", BROWSER) is None
+    assert clicks.check(1, "10.0.0.1", BROWSER) is None
+    clicks.remember(1, "10.0.0.1", BROWSER)
+    assert clicks.check(1, "10.0.0.1", BROWSER) == "duplicate"
+    assert clicks.check(2, "10.0.0.1", BROWSER) is None
+
+
+def test_failed_click_is_not_suppressed_on_retry(client, property_id, monkeypatch):
+    click_filter._recent.clear()
+    url = f"/api/properties/{property_id}/track-click/"
+
+    def fail(**kwargs):
+        raise RuntimeError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(properties_router, "create_property_click", fail)
+        assert client.post(url, headers={"User-Agent": BROWSER}).status_code == 500
+    assert client.post(url, headers={"User-Agent": BROWSER}).status_code == 201
+    response = client.post(url, headers={"User-Agent": BROWSER})
+    assert response.status_code == 202 and response.json()["reason"] == "duplicate"
+
+
+def test_unknown_property_is_404_before_filtering(client):
+    suppressed = dict(click_filter.stats()["suppressed"])
+    for headers in ({"User-Agent": "Googlebot/2.1"}, {"User-Agent": BROWSER, "Sec-Purpose": "prefetch"}):
+        assert client.post("/api/properties/999999/track-click/", headers=headers).status_code == 404
+    assert click_filter.stats()["suppressed"] == suppressed
@@ -0,0 +1,36 @@
+import time
+
+from core.database import SessionLocal
+from core.jobs import PeriodicJob
+from crud.job_leases import acquire_lease, release_leases
+
+
+def test_lease_has_one_holder_until_it_expires():
+    with SessionLocal() as db:
+        assert acquire_lease(db, "test_expiry", "worker-1", 0.5)
+        assert not acquire_lease(db, "test_expiry", "worker-2", 0.5)
+        assert acquire_lease(db, "test_expiry", "worker-1", 0.5)  # renewal
+        time.sleep(0.6)
+        assert acquire_lease(db, "test_expiry", "worker-2", 60)
+        assert not acquire_lease(db, "test_expiry", "worker-1", 60)
+
+
+def test_released_lease_is_taken_over():
+    with SessionLocal() as db:
+        assert acquire_lease(db, "test_release", "worker-1", 60)
+        release_leases(db, "worker-1")
+        assert acquire_lease(db, "test_release", "worker-2", 60)
+
+
+def test_job_without_lease_skips_its_run():
+    def holds_lease():
+        with SessionLocal() as db:
+            return acquire_lease(db, "test_job", "worker-2", 60)
+
+    with SessionLocal() as db:
+        assert acquire_lease(db, "test_job", "worker-1", 60)
+    calls = []
+    job = PeriodicJob("test_job", 60, lambda: calls.append(1), lease=holds_lease)
+    assert job.run_once() is None
+    assert calls == []
+    assert job.stats()["skipped"] == 1 and job.stats()["runs"] == 0
@@ -0,0 +1,15 @@
+from core.cache import invalidate_property_caches, property_list_cache
+from core.config import settings
+
+
+def test_anonymous_pages_are_cached(client):
+    invalidate_property_caches()
+    assert client.get("/api/properties/?limit=5").status_code == 200
+    assert property_list_cache.stats()["size"] == 1
+
+
+def test_oversized_pages_are_not_cached(client):
+    invalidate_property_caches()
+    response = client.get(f"/api/properties/?limit={settings.PROPERTY_CACHE_MAX_LIMIT + 1}")
+    assert response.status_code == 200 and "ETag" in response.headers
+    assert property_list_cache.stats()["size"] == 0
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import event
+
+import models
+from core.cache import invalidate_property_caches
+from core.database import SessionLocal, engine
+
+PAGE_SIZES = (5, 40)
+
+
+@pytest.fixture(scope="module")
+def property_ids():
+    db = SessionLocal()
+    try:
+        agents = [
+            models.User(username=f"agent{i}", email=f"agent{i}@example.com", password_hash="x", role=models.Role.staff)
+            for i in range(3)
+        ]
+        db.add_all(agents)
+        db.flush()
+        properties = []
+        for i in range(50):
+            prop = models.Property(
+                title=f"Property {i}", price=100000 + i, property_type="Casa", listing_type="Venta",
+                assigned_to_id=agents[i % 3].id, created_by_user_id=agents[(i + 1) % 3].id,
+            )
+            prop.images = [
+                models.PropertyImage(image_url=f"https://example.com/{i}/{n}.jpg", order=n) for n in range(2)
+            ]
+            properties.append(prop)
+        db.add_all(properties)
+        db.commit()
+        return [prop.id for prop in properties]
+    finally:
+        db.close()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self)
+
+
+def count_queries(client, url: str) -> int:
+    invalidate_property_caches()
+    with QueryCounter() as counter:
+        response = client.get(url)
+    assert response.status_code == 200, response.text
+    return counter.count
+
+
+def test_list_query_count_is_independent_of_page_size(client, property_ids):
+    counts = [count_queries(client, f"/api/properties/?limit={limit}") for limit in PAGE_SIZES]
+    assert counts[0] == counts[1]
+
+
+def test_list_query_count_with_cursor_is_independent_of_page_size(client, property_ids):
+    counts = []
+    for limit in PAGE_SIZES:
+        cursor = client.get(f"/api/properties/?limit={limit}").headers["X-Next-Cursor"]
+        counts.append(count_queries(client, f"/api/properties/?limit={limit}&cursor={cursor}"))
+    assert counts[0] == counts[1]
+
+
+def test_detail_query_count_is_independent_of_property(client, property_ids):
+    counts = [count_queries(client, f"/api/properties/{property_id}/") for property_id in property_ids[:2]]
+    assert counts[0] == counts[1]
+
+
+def test_batch_query_count_is_independent_of_batch_size(client, property_ids):
+    counts = [
+        count_queries(client, "/api/properties/batch/?ids=" + ",".join(map(str, property_ids[:size])))
+        for size in PAGE_SIZES
+    ]
+    assert counts[0] == counts[1]
@@ -0,0 +1,11 @@
+import models
+from core.database import SessionLocal, engine
+
+
+def test_create_all_is_repeatable():
+    # Runs on every start via core.database; must not re-seed row_counters
+    models.Base.metadata.create_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        counter = db.get(models.RowCounter, "properties")
+        assert counter.row_count == db.query(models.Property).count()
@@ -0,0 +1,33 @@
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+import models
+import schemas
+from core.serializers import dumps, serialize_many
+
+
+def pydantic_json(schema, objects) -> list:
+    return jsonable_encoder([schema.model_validate(obj, from_attributes=True) for obj in objects])
+
+
+@pytest.mark.parametrize("url", [
+    "http://example.com",
+    "https://example.com/photo.jpg",
+    "HTTPS://Images.Example.COM/photo.jpg",
+    "https://example.com:443/a b.jpg",
+    "http://café.example/ñ.png",
+])
+def test_fast_path_renders_urls_like_pydantic(url):
+    prop = models.Property(
+        id=1, title="Sample", image_url=url, click_count=0, created_at=datetime(2024, 1, 1),
+        images=[models.PropertyImage(id=1, property_id=1, image_url=url, order=0)],
+    )
+    assert json.loads(dumps(serialize_many(schemas.Property, [prop]))) == pydantic_json(schemas.Property, [prop])
+
+
+def test_fast_path_keeps_missing_urls():
+    prop = models.Property(id=1, title="Sample", image_url=None, click_count=0, created_at=datetime(2024, 1, 1))
+    assert serialize_many(schemas.Property, [prop])[0]["image_url"] is None
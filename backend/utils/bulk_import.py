@@ -0,0 +1,253 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# Incremental parsers for POST /api/properties/bulk/. Both take the request
+# body as it arrives and yield one record at a time, so a feed of any size is
+# processed with memory bounded by the largest single record.
+
+MAX_RECORD_CHARS = 1024 * 1024  # a single listing larger than this is treated as malformed
+IMAGE_URL_SEPARATOR = "|"  # separates additional_image_urls inside one CSV cell
+
+
+class JSONArrayParser:
+    """Parses a top-level JSON array fed in pieces, returning each element once it is complete."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = "start"  # start -> first -> (value -> sep)* -> done
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        self._buffer += text
+        items = []
+        pos = 0
+        buffer = self._buffer
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Expected a JSON array of properties")
+                self._state = "first"
+                pos += 1
+            elif self._state in ("first", "value"):
+                if self._state == "first" and char == "]":
+                    self._state = "done"
+                    pos += 1
+                    continue
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final or len(buffer) - pos > MAX_RECORD_CHARS:
+                        raise ValueError(f"Malformed JSON array item: {e.msg}") from e
+                    break  # incomplete item, wait for more data
+                if end == len(buffer) and not final:
+                    break  # a trailing number or literal may continue in the next chunk
+                items.append(item)
+                self._state = "sep"
+                pos = end
+            elif self._state == "sep":
+                if char == ",":
+                    self._state = "value"
+                elif char == "]":
+                    self._state = "done"
+                else:
+                    raise ValueError(f"Expected ',' or ']' between array items, got {char!r}")
+                pos += 1
+            else:
+                raise ValueError("Unexpected data after the end of the JSON array")
+        self._buffer = buffer[pos:]
+        if final and self._state != "done":
+            raise ValueError("Unexpected end of JSON array")
+        return items
+
+
+class CSVRecordParser:
+    """Splits CSV text fed in pieces into records, keeping quoted multi-line fields together."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._pending = ""
+        self._pending_quotes = 0
+
+    def feed(self, text: str, final: bool = False) -> List[List[str]]:
+        self._buffer += text
+        if final:
+            lines, self._buffer = self._buffer, ""
+        else:
+            cut = self._buffer.rfind("\n") + 1
+            lines, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        records = []
+        parts = lines.split("\n")
+        for index, part in enumerate(parts):
+            line = part + "\n" if index < len(parts) - 1 else part
+            if not line:
+                continue
+            self._pending += line
+            self._pending_quotes += line.count('"')
+            if len(self._pending) > MAX_RECORD_CHARS:
+                raise ValueError("CSV record too large or has an unterminated quote")
+            if self._pending_quotes % 2:
+                continue  # inside a quoted field that spans lines
+            if self._pending.strip():
+                records.append(next(csv.reader([self._pending], strict=True)))
+            self._pending, self._pending_quotes = "", 0
+        if final and self._pending:
+            raise ValueError("Unterminated quoted field at end of CSV")
+        return records
+
+
+class MultipartFileReader:
+    """Streams one file field out of a multipart/form-data body as it arrives.
+
+    Unlike Request.form(), nothing is spooled: open() parses up to the start of
+    the field (setting filename and content_type), then chunks() yields its data.
+    Other fields are skipped. Raises ValueError on malformed input.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], content_type: str, field_name: str = "file"):
+        _, options = parse_options_header(content_type)
+        if not options.get(b"boundary"):
+            raise ValueError("Multipart body without a boundary.")
+        self.field_name = field_name
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self._chunks = chunks.__aiter__()
+        self._pending: List[bytes] = []
+        self._found = self._in_field = self._done = False
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = self._header_value = b""
+        self._parser = MultipartParser(options[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, disposition = parse_options_header(self._headers.get(b"content-disposition"))
+        if self._found or disposition.get(b"name", b"").decode("utf-8", "replace") != self.field_name:
+            return
+        if b"filename" not in disposition:
+            raise ValueError(f"'{self.field_name}' must be a file upload.")
+        self._found = self._in_field = True
+        self.filename = disposition[b"filename"].decode("utf-8", "replace")
+        content_type = self._headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1").split(";")[0].strip().lower() if content_type else None
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_field:
+            self._pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_field:
+            self._in_field = False
+            self._done = True
+
+    async def _feed(self) -> bool:
+        """Parse the next piece of the body; False once the body is exhausted."""
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._parser.finalize()
+            return False
+        self._parser.write(chunk)
+        return True
+
+    async def open(self) -> "MultipartFileReader":
+        while not self._found:
+            if not await self._feed():
+                raise ValueError(f"Multipart requests need a '{self.field_name}' field.")
+        return self
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        while True:
+            while self._pending:
+                yield self._pending.pop(0)
+            if self._done:
+                return
+            if not await self._feed():
+                raise ValueError(f"Multipart body ended inside the '{self.field_name}' field.")
+
+
+async def _decode(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    yield decoder.decode(b"", final=True)
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array body as they arrive. Raises ValueError on malformed input."""
+    parser = JSONArrayParser()
+    try:
+        async for text in _decode(chunks):
+            for item in parser.feed(text):
+                yield item
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Body is not valid UTF-8: {e}") from e
+    for item in parser.feed("", final=True):
+        yield item
+
+
+async def iter_csv_dicts(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Optional[str]]]:
+    """Yield the data rows of a CSV body with a header row as dicts.
+
+    Empty cells are left out so model defaults apply, and additional_image_urls
+    is split on IMAGE_URL_SEPARATOR. Raises ValueError on malformed input.
+    """
+    parser = CSVRecordParser()
+    header = None
+
+    def to_dict(record: List[str]) -> Dict[str, Any]:
+        row = {name: value.strip() for name, value in zip(header, record) if value.strip()}
+        if "additional_image_urls" in row:
+            row["additional_image_urls"] = [
+                url.strip() for url in row["additional_image_urls"].split(IMAGE_URL_SEPARATOR) if url.strip()
+            ]
+        return row
+
+    try:
+        async for text in _decode(chunks):
+            for record in parser.feed(text):
+                if header is None:
+                    header = [name.strip() for name in record]
+                    continue
+                yield to_dict(record)
+        for record in parser.feed("", final=True):
+            if header is None:
+                header = [name.strip() for name in record]
+                continue
+            yield to_dict(record)
+    except csv.Error as e:
+        raise ValueError(f"Malformed CSV: {e}") from e
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Body is not valid UTF-8: {e}") from e
@@ -0,0 +1,141 @@
+import math
+from typing import List, Optional, Tuple
+
+# Geohash helpers for the properties.geohash column.
+#
+# A geohash is a base-32 string whose prefixes name ever-coarser grid cells,
+# so "all points inside cell P" is the btree range [P, P + "~"). A bounding box
+# is answered by covering it with a handful of cells and OR-ing their ranges,
+# which works the same on SQLite and PostgreSQL without spatial extensions.
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9  # ~4.8m x 4.8m cells
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LNG_AT_EQUATOR = 111.320
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # bits alternate longitude, latitude, starting with longitude
+    while len(chars) < precision:
+        rng, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """(height in degrees of latitude, width in degrees of longitude) of a cell."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def geohash_cover(min_lat: float, min_lng: float, max_lat: float, max_lng: float, max_cells: int = 32) -> List[str]:
+    """Geohash prefixes whose cells together cover the bounding box.
+
+    Picks the finest precision that needs at most `max_cells` cells.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision)
+        row0, row1 = int((min_lat + 90.0) // height), int((max_lat + 90.0) // height)
+        col0, col1 = int((min_lng + 180.0) // width), int((max_lng + 180.0) // width)
+        if (row1 - row0 + 1) * (col1 - col0 + 1) <= max_cells:
+            break
+    cells = []
+    for row in range(row0, row1 + 1):
+        for col in range(col0, col1 + 1):
+            lat = min(-90.0 + (row + 0.5) * height, 90.0)
+            lng = min(-180.0 + (col + 0.5) * width, 180.0)
+            cells.append(geohash_encode(lat, lng, precision))
+    return sorted(set(cells))
+
+
+def geohash_prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every geohash starting with `prefix`."""
+    return prefix + "~"  # '~' sorts after every geohash character
+
+
+def bbox_around(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, min_lng, max_lat, max_lng) of the box enclosing a circle."""
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    d_lng = radius_km / max(KM_PER_DEGREE_LNG_AT_EQUATOR * math.cos(math.radians(latitude)), 1e-6)
+    return (
+        max(latitude - d_lat, -90.0),
+        max(longitude - d_lng, -180.0),
+        min(latitude + d_lat, 90.0),
+        min(longitude + d_lng, 180.0),
+    )
+
+
+def km_per_degree(latitude: float) -> Tuple[float, float]:
+    """Scale factors (km per degree of latitude, km per degree of longitude) around `latitude`.
+
+    Used for equirectangular distances, which are accurate to well under 1%
+    at city scale and need only arithmetic in SQL.
+    """
+    return KM_PER_DEGREE_LAT, KM_PER_DEGREE_LNG_AT_EQUATOR * math.cos(math.radians(latitude))
+
+
+def tile_size(zoom: int) -> float:
+    """Side in degrees of the square map tiles at `zoom`; zoom 0 is one tile spanning the globe."""
+    return 360.0 / (1 << zoom)
+
+
+def tiles_covering(min_lat: float, min_lng: float, max_lat: float, max_lng: float, zoom: int) -> List[Tuple[int, int]]:
+    """(x, y) of every tile at `zoom` that intersects the bounding box."""
+    size = tile_size(zoom)
+    max_x = (1 << zoom) - 1
+    max_y = math.ceil(180.0 / size) - 1
+    x0, x1 = (min(int((lng + 180.0) // size), max_x) for lng in (min_lng, max_lng))
+    y0, y1 = (min(int((lat + 90.0) // size), max_y) for lat in (min_lat, max_lat))
+    return [(x, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)]
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """(min_lat, min_lng, max_lat, max_lng) of a tile."""
+    size = tile_size(zoom)
+    min_lat = -90.0 + y * size
+    min_lng = -180.0 + x * size
+    return min_lat, min_lng, min(min_lat + size, 90.0), min(min_lng + size, 180.0)
+
+
+def parse_bbox(value: str) -> Tuple[float, float, float, float]:
+    """Parse 'min_lng,min_lat,max_lng,max_lat' into (min_lat, min_lng, max_lat, max_lng)."""
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError("bbox must be 'min_lng,min_lat,max_lng,max_lat'")
+    min_lng, min_lat, max_lng, max_lat = parts
+    if not (-180.0 <= min_lng <= max_lng <= 180.0 and -90.0 <= min_lat <= max_lat <= 90.0):
+        raise ValueError("bbox is out of range or crosses the antimeridian")
+    return min_lat, min_lng, max_lat, max_lng
+
+
+def parse_point(value: str) -> Tuple[float, float]:
+    """Parse 'lat,lng'."""
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 2 or not (-90.0 <= parts[0] <= 90.0 and -180.0 <= parts[1] <= 180.0):
+        raise ValueError("near must be 'lat,lng'")
+    return parts[0], parts[1]
+
+
+def point_geohash(latitude: Optional[float], longitude: Optional[float]) -> Optional[str]:
+    if latitude is None or longitude is None:
+        return None
+    return geohash_encode(latitude, longitude)
@@ -1,7 +1,7 @@
 import HeroSection from '../components/HeroSection';
 import PropertySlider from '../components/PropertySlider';
 import { fetchSiteSettings } from '../services/settingsService';
-import { fetchProperties } from '../services/propertyService';
+import { fetchProperties, fetchFeaturedProperties } from '../services/propertyService';
 import { useSettings } from '../context/SettingsContext';
 import Head from 'next/head';
 
@@ -30,8 +30,10 @@ export async function getServerSideProps() {
     // Optionally fetch site settings for dynamic content
     await fetchSiteSettings();
     // Fetch all properties
-    const properties = await fetchProperties();
-    const featuredProperties = properties.filter(p => p.is_featured).slice(0, 10);
+    const [properties, featuredProperties] = await Promise.all([
+      fetchProperties(),
+      fetchFeaturedProperties(),
+    ]);
     const recentProperties = properties
       .sort((a, b) => new Date(b.created_at) - new Date(a.created_at))
       .slice(0, 10);
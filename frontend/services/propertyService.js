@@ -34,6 +34,18 @@ export async function fetchProperties(query = "") {
   }
 }
 
+export async function fetchFeaturedProperties() {
+  const fetchUrl = `${API_BASE}/properties/featured/`;
+  console.log("[PropertyService] fetchFeaturedProperties called. URL:", fetchUrl);
+  const res = await fetch(fetchUrl);
+  if (!res.ok) {
+    const errorText = await res.text();
+    console.error("[PropertyService] Failed fetching featured properties. Status:", res.status, "URL:", fetchUrl, "Response:", errorText);
+    throw new Error(`Failed fetching featured properties. Status: ${res.status}. URL: ${fetchUrl}. Response: ${errorText}`);
+  }
+  return res.json();
+}
+
 export async function fetchProperty(id) {
   const fetchUrl = `${API_BASE}/properties/${id}/`;
   console.log("[PropertyService] fetchProperty called for id:", id, "URL:", fetchUrl);